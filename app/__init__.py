@@ -1,21 +1,42 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.admission import AdmissionMiddleware, default_policies
 from app.core.config import settings
+from app.core.profiling import ProfilingMiddleware
+from app.core.state import state_store
 from app.api.v1.api import api_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 수용 제어 설정 오류(클라이언트별 한도 등)는 첫 요청이 아니라 시작 시 드러나도록 미리 검사
+    default_policies()
+    yield
+    # 종료 시 진행 중 요청이 끝난 뒤 공유 상태 연결 정리
+    await state_store.close()
+
 app = FastAPI(
     title="Outer - AI Coding Platform",
     description="AI-powered coding platform with Figma integration and automated deployment",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS 설정
+# 요청 프로파일링 (관리자 헤더/샘플링/느린 요청)
+# 수용 제어 안쪽에 두어 마감 시간 처리용 태스크 안에서 핸들러와 같은 태스크로 샘플링
+app.add_middleware(ProfilingMiddleware)
+
+# 오래 걸리는 엔드포인트 동시 실행 제한 및 마감 시간
+app.add_middleware(AdmissionMiddleware)
+
+# CORS 설정 (마지막에 추가해 가장 바깥에서 실행 - 503/429 거절 응답에도 CORS 헤더가 붙도록)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After", "X-Profile-Id"],
 )
 
 # API 라우터 등록
@@ -0,0 +1,37 @@
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+from app.core.config import settings
+from app.core.profiling import request_profiler
+
+router = APIRouter()
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """X-Admin-Token 헤더 확인 (PROFILING_ADMIN_TOKEN 미설정 시 관리자 API 비활성화)"""
+    if not settings.PROFILING_ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin API is disabled")
+    # 바이트로 비교 (비ASCII 문자열은 compare_digest에서 TypeError)
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode(), settings.PROFILING_ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+async def list_profiles():
+    """보관 중인 요청 프로파일 목록 (최신순, 모든 워커)"""
+    return {
+        "success": True,
+        "profiles": await request_profiler.list_profiles()
+    }
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+async def download_profile(profile_id: str):
+    """요청 프로파일을 collapsed stack 형식으로 다운로드 (flamegraph.pl, speedscope에서 열기)"""
+    profile = await request_profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile["collapsed"],
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile["id"]}.folded"'}
+    )
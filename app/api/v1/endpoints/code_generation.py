@@ -94,7 +94,7 @@ async def enhance_code(request: CodeOptimizationRequest):
         """
         
         # Gemini 서비스의 모델을 직접 사용
-        response = gemini_service.model.generate_content(enhancement_prompt)
+        response = await gemini_service.model.generate_content_async(enhancement_prompt)
         enhanced_code = response.text
         
         return {
@@ -103,4 +103,12 @@ async def enhance_code(request: CodeOptimizationRequest):
             "enhanced_code": enhanced_code
         }
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/stats")
+async def get_generation_stats():
+    """생성 모드별 출력 토큰/지연 시간 통계 (골격 로컬 렌더링 절감 효과)"""
+    return {
+        "success": True,
+        "stats": await gemini_service.get_generation_stats()
+    }
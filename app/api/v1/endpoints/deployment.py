@@ -1,7 +1,12 @@
+import asyncio
+import json
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Dict, Optional
 from pydantic import BaseModel
+from app.services.build_cache import build_cache_service
 from app.services.deployment_service import deployment_service
+from app.services.deployment_status_service import deployment_status_service
 
 router = APIRouter()
 
@@ -26,15 +31,28 @@ async def deploy_project(request: DeploymentRequest):
             result = await deployment_service.deploy_to_github_pages(
                 request.project_data, request.project_name
             )
+        elif request.platform in deployment_status_service.platforms:
+            # 오프라인 테스트용 가짜 플랫폼 (실제 배포 없이 기록만)
+            result = {"success": True, "project_id": request.project_name}
         else:
             raise HTTPException(status_code=400, detail="Unsupported platform")
         
         if result["success"]:
+            # 상태 조회용 플랫폼 배포 ID 기록 (Vercel은 배포 URL 호스트명, GitHub Pages는 owner/repo)
+            url = result.get("url")
+            deployment_id = result.get("repo_full_name") or request.project_name
+            if request.platform == "vercel" and url:
+                deployment_id = url.replace("https://", "").strip("/")
+            await deployment_status_service.record_deployment(
+                request.project_name, request.platform, deployment_id, url
+            )
+            
             return {
                 "success": True,
                 "deployment_url": result.get("url"),
                 "project_id": result.get("project_id"),
-                "platform": request.platform
+                "platform": request.platform,
+                "build_cache": result.get("build_cache")
             }
         else:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -42,26 +60,73 @@ async def deploy_project(request: DeploymentRequest):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/deployments")
+async def list_deployments():
+    """배포 목록 (캐시된 최신 상태 반영)"""
+    try:
+        deployments = await deployment_status_service.list_deployments()
+        # 캐시가 만료된 배포만 업스트림 조회하며, 조회는 동시에 진행
+        statuses = await asyncio.gather(*(
+            deployment_status_service.get_status(record["platform"], record["deployment_id"])
+            for record in deployments
+        ), return_exceptions=True)
+        
+        for record, status in zip(deployments, statuses):
+            if isinstance(status, Exception):
+                # 마지막으로 기록된 상태를 유지하고 조회 실패 사유를 함께 반환
+                record["status_error"] = str(status)
+                continue
+            record["status"] = status["status"]
+            record["updated_at"] = status["last_updated"]
+        
+        return {
+            "success": True,
+            "deployments": deployments
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/status/{project_id}")
 async def get_deployment_status(project_id: str, platform: str = "vercel"):
     """배포 상태 확인"""
     try:
-        # 실제 구현에서는 배포 플랫폼 API를 호출하여 상태 확인
+        # 짧은 TTL 캐시를 거쳐 플랫폼 API 조회 (여러 클라이언트가 같은 배포를 봐도 업스트림 호출은 한 번)
+        platform, deployment_id = await deployment_status_service.resolve(project_id, platform)
+        status = await deployment_status_service.get_status(platform, deployment_id)
         return {
             "success": True,
             "project_id": project_id,
             "platform": platform,
-            "status": "deployed",  # deployed, building, failed
-            "last_updated": "2024-01-01T00:00:00Z"
+            "status": status["status"],  # deployed, building, failed, canceled, unknown
+            "last_updated": status["last_updated"]
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/status/{project_id}/events")
+async def stream_deployment_status(project_id: str, platform: str = "vercel"):
+    """배포 상태 변경을 SSE로 전달 (종료 상태가 되면 스트림 종료)"""
+    platform, deployment_id = await deployment_status_service.resolve(project_id, platform)
+    if platform not in deployment_status_service.platforms:
+        raise HTTPException(status_code=400, detail="Unsupported platform")
+    
+    async def events():
+        async for status in deployment_status_service.subscribe(platform, deployment_id):
+            payload = dict(status, project_id=project_id)
+            yield f"event: status\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.delete("/{project_id}")
 async def delete_deployment(project_id: str, platform: str = "vercel"):
     """배포 삭제"""
     try:
-        # 실제 구현에서는 배포 플랫폼 API를 호출하여 삭제
+        platform, deployment_id = await deployment_status_service.resolve(project_id, platform)
+        await deployment_status_service.delete(platform, deployment_id, project_id)
         return {
             "success": True,
             "project_id": project_id,
@@ -71,6 +136,14 @@ async def delete_deployment(project_id: str, platform: str = "vercel"):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/cache/stats")
+async def get_build_cache_stats():
+    """배포 빌드 캐시 적중률 및 절약 시간"""
+    return {
+        "success": True,
+        "stats": await build_cache_service.get_stats()
+    }
+
 @router.get("/platforms")
 async def get_supported_platforms():
     """지원되는 배포 플랫폼 목록"""
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, Optional
 from pydantic import BaseModel
-from app.services.figma_service import figma_service
+from app.core.config import settings
+from app.services.figma_service import figma_service, FigmaSubtree
 from app.services.gemini_service import gemini_service
 
 router = APIRouter()
@@ -9,19 +10,31 @@ router = APIRouter()
 class FigmaFileRequest(BaseModel):
     file_key: str
     node_id: Optional[str] = None
+    depth: Optional[int] = None
+    max_depth: Optional[int] = None
 
 class FigmaToCodeRequest(BaseModel):
     file_key: str
     node_id: Optional[str] = None
+    depth: Optional[int] = None
+    max_depth: Optional[int] = None
     framework: str = "react"
     include_images: bool = True
+    streaming: Optional[bool] = None
 
 @router.post("/file")
 async def get_figma_file(request: FigmaFileRequest):
     """피그마 파일 데이터 가져오기"""
     try:
-        data = await figma_service.get_file_data(request.file_key, request.node_id)
-        return {"success": True, "data": data}
+        if not request.node_id:
+            data = await figma_service.get_file_data(request.file_key)
+            return {"success": True, "data": data, "truncated": False}
+        
+        # 노드 지정 시 max_depth 레벨까지 잘린 자식을 불러온 뒤 반환 (그 아래가 남으면 truncated)
+        max_depth = settings.FIGMA_MAX_DEPTH if request.max_depth is None else request.max_depth
+        subtree = await figma_service.get_node_subtree(request.file_key, request.node_id, request.depth)
+        await subtree.load(max_depth)
+        return {"success": True, "data": subtree.data, "truncated": subtree.truncated}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -29,18 +42,27 @@ async def get_figma_file(request: FigmaFileRequest):
 async def figma_to_code(request: FigmaToCodeRequest):
     """피그마 디자인을 코드로 변환"""
     try:
-        # 피그마 데이터 가져오기
-        figma_data = await figma_service.get_file_data(request.file_key, request.node_id)
+        # 피그마 데이터 가져오기 (노드 지정 시 서브트리만, 깊은 자식은 지연 로딩)
+        streaming = settings.FIGMA_STREAMING if request.streaming is None else request.streaming
+        if request.node_id:
+            figma_data = await figma_service.get_node_subtree(
+                request.file_key, request.node_id, request.depth, streaming
+            )
+        else:
+            figma_data = FigmaSubtree(
+                await figma_service.get_file_data(request.file_key, streaming=streaming)
+            )
         
-        # 디자인 토큰 추출
-        design_tokens = await figma_service.extract_design_tokens(figma_data)
+        # 디자인 토큰 추출 (max_depth 레벨까지의 잘린 자식은 레벨 단위로 한 번에 로딩)
+        max_depth = settings.FIGMA_MAX_DEPTH if request.max_depth is None else request.max_depth
+        design_tokens = await figma_service.extract_design_tokens(figma_data, max_depth)
         
         # 코드 구조 파싱
-        code_structure = await figma_service.parse_figma_to_code_structure(figma_data)
+        code_structure = await figma_service.parse_figma_to_code_structure(figma_data, max_depth)
         
         # Gemini로 코드 생성
         generated_code = await gemini_service.generate_code_from_figma(
-            figma_data, request.framework
+            figma_data.data, request.framework
         )
         
         # 이미지 처리 (필요시)
@@ -60,11 +82,19 @@ async def figma_to_code(request: FigmaToCodeRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/design-tokens/{file_key}")
-async def extract_design_tokens(file_key: str, node_id: Optional[str] = None):
+async def extract_design_tokens(file_key: str, node_id: Optional[str] = None, depth: Optional[int] = None,
+                                max_depth: Optional[int] = None, streaming: Optional[bool] = None):
     """피그마에서 디자인 토큰 추출"""
     try:
-        figma_data = await figma_service.get_file_data(file_key, node_id)
-        design_tokens = await figma_service.extract_design_tokens(figma_data)
+        if streaming is None:
+            streaming = settings.FIGMA_STREAMING
+        if node_id:
+            figma_data = await figma_service.get_node_subtree(file_key, node_id, depth, streaming)
+        else:
+            figma_data = await figma_service.get_file_data(file_key, streaming=streaming)
+        design_tokens = await figma_service.extract_design_tokens(
+            figma_data, settings.FIGMA_MAX_DEPTH if max_depth is None else max_depth
+        )
         return {"success": True, "design_tokens": design_tokens}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
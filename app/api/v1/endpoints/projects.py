@@ -1,7 +1,11 @@
+import asyncio
 from fastapi import APIRouter, HTTPException
 from typing import Dict, List, Optional
 from pydantic import BaseModel
 from datetime import datetime
+from app.core.state import state_store
+from app.services.blob_store import blob_store
+from app.services.project_storage_service import project_storage_service
 
 router = APIRouter()
 
@@ -17,14 +21,49 @@ class ProjectUpdateRequest(BaseModel):
     description: Optional[str] = None
     code: Optional[Dict] = None
 
-# 임시 프로젝트 저장소 (실제로는 데이터베이스 사용)
-projects_db = {}
+# 프로젝트는 워커 간 공유 상태 저장소에 보관
+# source_data와 코드는 blob 저장소에 두고 해시만 보관
+PROJECTS = "projects"
+
+async def _load_project(project_id: str) -> Dict:
+    project = await state_store.get(PROJECTS, project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
+def _summarize_project(project: Dict) -> Dict:
+    """목록용 프로젝트 요약 (blob을 읽지 않음)"""
+    result = {
+        key: value for key, value in project.items()
+        if key not in ("source_data_hash", "versions")
+    }
+    if project["versions"]:
+        result["version"] = project["versions"][-1]["version"]
+    return result
+
+def _load_blobs(project: Dict) -> Dict:
+    """저장된 프로젝트를 응답 형태로 변환 (blob 내용 복원, 파일 I/O)"""
+    result = _summarize_project(project)
+    result["source_data"] = blob_store.get_json(project["source_data_hash"])
+    if project["versions"]:
+        result["code"] = project_storage_service.load_code(project["versions"][-1]["manifest"])
+    return result
+
+async def _serialize_project(project: Dict) -> Dict:
+    # blob 파일 읽기는 이벤트 루프를 막지 않도록 스레드에서
+    return await asyncio.to_thread(_load_blobs, project)
+
+def _get_version(project: Dict, version: int) -> Dict:
+    for entry in project["versions"]:
+        if entry["version"] == version:
+            return entry
+    raise HTTPException(status_code=404, detail="Version not found")
 
 @router.post("/")
 async def create_project(request: ProjectCreateRequest):
     """새 프로젝트 생성"""
     try:
-        project_id = f"proj_{len(projects_db) + 1}"
+        project_id = f"proj_{await state_store.incr('counters', PROJECTS)}"
         
         project = {
             "id": project_id,
@@ -32,28 +71,29 @@ async def create_project(request: ProjectCreateRequest):
             "description": request.description,
             "framework": request.framework,
             "source_type": request.source_type,
-            "source_data": request.source_data,
+            "source_data_hash": blob_store.put_json(request.source_data),
+            "versions": [],
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
             "status": "created"
         }
         
-        projects_db[project_id] = project
+        await state_store.set(PROJECTS, project_id, project)
         
         return {
             "success": True,
-            "project": project
+            "project": await _serialize_project(project)
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/")
 async def list_projects():
-    """프로젝트 목록 조회"""
+    """프로젝트 목록 조회 (요약만, 코드/원본 데이터는 상세 조회에서)"""
     try:
         return {
             "success": True,
-            "projects": list(projects_db.values())
+            "projects": [_summarize_project(project) for project in await state_store.values(PROJECTS)]
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -62,12 +102,11 @@ async def list_projects():
 async def get_project(project_id: str):
     """프로젝트 상세 조회"""
     try:
-        if project_id not in projects_db:
-            raise HTTPException(status_code=404, detail="Project not found")
+        project = await _load_project(project_id)
         
         return {
             "success": True,
-            "project": projects_db[project_id]
+            "project": await _serialize_project(project)
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -76,24 +115,29 @@ async def get_project(project_id: str):
 async def update_project(project_id: str, request: ProjectUpdateRequest):
     """프로젝트 수정"""
     try:
-        if project_id not in projects_db:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        project = projects_db[project_id]
+        # 코드 blob은 미리 저장해 두고, 버전 추가는 원자적 갱신 안에서 (동시 수정 시 재시도)
+        manifest_hash = project_storage_service.save_code(request.code) if request.code else None
         
-        if request.name:
-            project["name"] = request.name
-        if request.description:
-            project["description"] = request.description
-        if request.code:
-            project["code"] = request.code
+        def apply(project: Optional[Dict]) -> Dict:
+            if project is None:
+                raise HTTPException(status_code=404, detail="Project not found")
+            if request.name:
+                project["name"] = request.name
+            if request.description:
+                project["description"] = request.description
+            if manifest_hash:
+                project_storage_service.add_manifest_version(project["versions"], manifest_hash)
+            project["updated_at"] = datetime.now().isoformat()
+            return project
         
-        project["updated_at"] = datetime.now().isoformat()
+        project = await state_store.update(PROJECTS, project_id, apply)
         
         return {
             "success": True,
-            "project": project
+            "project": await _serialize_project(project)
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -101,11 +145,9 @@ async def update_project(project_id: str, request: ProjectUpdateRequest):
 async def delete_project(project_id: str):
     """프로젝트 삭제"""
     try:
-        if project_id not in projects_db:
+        if not await state_store.delete(PROJECTS, project_id):
             raise HTTPException(status_code=404, detail="Project not found")
         
-        del projects_db[project_id]
-        
         return {
             "success": True,
             "message": "Project deleted successfully"
@@ -117,16 +159,67 @@ async def delete_project(project_id: str):
 async def export_project(project_id: str, format: str = "zip"):
     """프로젝트 내보내기"""
     try:
-        if project_id not in projects_db:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        project = projects_db[project_id]
+        project = await _load_project(project_id)
         
         # 실제 구현에서는 프로젝트 파일들을 압축하여 다운로드 링크 생성
+        manifest = {}
+        if project["versions"]:
+            manifest = project_storage_service.load_manifest(project["versions"][-1]["manifest"])
+        
         return {
             "success": True,
             "download_url": f"/api/v1/projects/{project_id}/download",
-            "format": format
+            "format": format,
+            "manifest": manifest
         }
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{project_id}/versions")
+async def list_project_versions(project_id: str):
+    """프로젝트 코드 버전 이력 조회"""
+    try:
+        project = await _load_project(project_id)
+        
+        return {
+            "success": True,
+            "versions": project["versions"]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{project_id}/versions/{version}")
+async def get_project_version(project_id: str, version: int):
+    """특정 버전의 코드 조회"""
+    try:
+        project = await _load_project(project_id)
+        entry = _get_version(project, version)
+        
+        return {
+            "success": True,
+            "version": entry,
+            "code": project_storage_service.load_code(entry["manifest"])
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{project_id}/diff")
+async def diff_project_versions(project_id: str, from_version: int, to_version: int):
+    """두 버전 사이의 변경 파일 목록"""
+    try:
+        project = await _load_project(project_id)
+        before = _get_version(project, from_version)
+        after = _get_version(project, to_version)
+        
+        return {
+            "success": True,
+            "diff": project_storage_service.diff(before["manifest"], after["manifest"])
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
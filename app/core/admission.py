@@ -0,0 +1,168 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+from starlette.responses import JSONResponse
+from app.core.config import settings
+
+class Overloaded(Exception):
+    """대기열이 가득 찼거나 클라이언트 한도를 초과한 경우"""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+class RoutePolicy:
+    """경로별 동시 실행 한도, 제한된 대기열, 요청 마감 시간, 클라이언트별 동시 요청 한도"""
+
+    def __init__(self, name: str, max_concurrent: int, deadline: float,
+                 max_queue: Optional[int] = None, queue_timeout: Optional[float] = None,
+                 per_client: Optional[int] = None):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.deadline = deadline
+        self.max_queue = max_queue if max_queue is not None else max_concurrent * settings.ADMISSION_QUEUE_FACTOR
+        self.queue_timeout = queue_timeout if queue_timeout is not None else settings.ADMISSION_QUEUE_TIMEOUT
+        # 한 클라이언트가 모든 실행 슬롯을 차지하지 못하도록 기본값은 동시 실행 한도의 절반
+        self.per_client = per_client if per_client is not None else max(1, max_concurrent // 2)
+        if self.per_client < 1 or (max_concurrent > 1 and self.per_client >= max_concurrent):
+            raise ValueError(
+                f"{name}: per-client limit ({self.per_client}) must be between 1 and "
+                f"max_concurrent - 1 ({max_concurrent - 1})"
+            )
+        self.running = 0
+        self.waiting = 0
+        self.clients: Dict[str, int] = {}
+        # 처리 시간 이동 평균 (Retry-After 추정용)
+        self.average_seconds = 1.0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def retry_after(self) -> int:
+        """현재 대기열이 비워지는 데 걸릴 대략적인 시간 (초)"""
+        backlog = self.waiting + self.running
+        return max(1, math.ceil(self.average_seconds * backlog / self.max_concurrent))
+
+    @asynccontextmanager
+    async def admit(self, client: str):
+        if self.clients.get(client, 0) >= self.per_client:
+            raise Overloaded(429, "Too many concurrent requests for this client", self.retry_after())
+        if self.running + self.waiting >= self.max_concurrent + self.max_queue:
+            raise Overloaded(503, f"Server is overloaded ({self.name})", self.retry_after())
+
+        self.clients[client] = self.clients.get(client, 0) + 1
+        try:
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise Overloaded(503, f"Server is overloaded ({self.name})", self.retry_after())
+            finally:
+                self.waiting -= 1
+
+            self.running += 1
+            started = time.monotonic()
+            try:
+                yield
+            finally:
+                self.running -= 1
+                self._semaphore.release()
+                self.average_seconds = 0.8 * self.average_seconds + 0.2 * (time.monotonic() - started)
+        finally:
+            self.clients[client] -= 1
+            if not self.clients[client]:
+                del self.clients[client]
+
+    def snapshot(self) -> Dict:
+        return {
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "clients": len(self.clients)
+        }
+
+def default_policies() -> List[Tuple[str, str, RoutePolicy]]:
+    """(메서드, 경로 접두사, 정책) 목록 - 오래 걸리는 엔드포인트만 제한"""
+    prefix = settings.API_V1_STR
+    return [
+        ("POST", f"{prefix}/figma/to-code",
+         RoutePolicy("figma-to-code", settings.FIGMA_TO_CODE_CONCURRENCY, settings.FIGMA_TO_CODE_DEADLINE,
+                     per_client=settings.FIGMA_TO_CODE_PER_CLIENT)),
+        ("POST", f"{prefix}/code/",
+         RoutePolicy("code", settings.CODE_CONCURRENCY, settings.CODE_DEADLINE,
+                     per_client=settings.CODE_PER_CLIENT)),
+        ("POST", f"{prefix}/deploy/deploy",
+         RoutePolicy("deploy", settings.DEPLOY_CONCURRENCY, settings.DEPLOY_DEADLINE,
+                     per_client=settings.DEPLOY_PER_CLIENT)),
+    ]
+
+class AdmissionMiddleware:
+    """과부하 시 즉시 503/429로 거절하고, 마감 시간이 지나면 업스트림 작업까지 취소하는 ASGI 미들웨어"""
+
+    def __init__(self, app, policies: Optional[List[Tuple[str, str, RoutePolicy]]] = None):
+        self.app = app
+        self.policies = policies if policies is not None else default_policies()
+        self.trusted_proxies = {
+            proxy.strip() for proxy in settings.ADMISSION_TRUSTED_PROXIES.split(",") if proxy.strip()
+        }
+
+    def match(self, method: str, path: str) -> Optional[RoutePolicy]:
+        for policy_method, prefix, policy in self.policies:
+            if method == policy_method and path.startswith(prefix):
+                return policy
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            async with policy.admit(self._client_id(scope)):
+                # 마감 시간 초과 시 핸들러 태스크가 취소되어 진행 중인 LLM/피그마 호출도 중단됨
+                await asyncio.wait_for(self.app(scope, receive, tracked_send), policy.deadline)
+        except Overloaded as e:
+            response = JSONResponse(
+                {"detail": e.detail},
+                status_code=e.status_code,
+                headers={"Retry-After": str(e.retry_after)}
+            )
+            await response(scope, receive, send)
+        except asyncio.TimeoutError:
+            if not response_started:
+                response = JSONResponse({"detail": "Request deadline exceeded"}, status_code=504)
+                await response(scope, receive, send)
+
+    def _client_id(self, scope) -> str:
+        """클라이언트 식별자 (접속 IP, 신뢰하는 프록시를 거친 경우 X-Forwarded-For의 원래 IP)
+
+        클라이언트가 임의로 바꿀 수 있는 헤더는 신뢰하지 않는다.
+        """
+        client = scope.get("client")
+        address = client[0] if client else "unknown"
+        if address not in self.trusted_proxies:
+            return address
+
+        for name, value in scope.get("headers", []):
+            if name == b"x-forwarded-for":
+                # 오른쪽부터 신뢰하는 프록시가 아닌 첫 주소가 실제 클라이언트
+                for hop in reversed([part.strip() for part in value.decode("latin-1").split(",")]):
+                    if hop and hop not in self.trusted_proxies:
+                        return hop
+        return address
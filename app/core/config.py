@@ -9,13 +9,61 @@ class Settings(BaseSettings):
     
     # Gemini API
     GEMINI_API_KEY: str
+    CODE_CHUNK_TOKENS: int = 2000
+    CODE_CHUNK_CONCURRENCY: int = 4
+    
+    # 프로젝트 골격 로컬 렌더링 (템플릿이 있는 프레임워크만)
+    SCAFFOLD_ENABLED: bool = True
+    SCAFFOLD_BASELINE_RATE: float = 0.05  # 절감 효과 비교용으로 전체 생성 모드를 쓰는 요청 비율
+    
+    # 유사 설명 캐시 (MinHash)
+    PROMPT_CACHE_ENABLED: bool = True
+    PROMPT_CACHE_THRESHOLD: float = 0.95  # 단어/단어 쌍 집합의 Jaccard 유사도
+    PROMPT_CACHE_MAX_DIFF: int = 1  # 허용하는 shingle 차이(대칭차) 개수 - 긴 설명에서 단어 하나만 바뀐 경우도 거름
+    PROMPT_CACHE_TTL: float = 86400.0
+    PROMPT_CACHE_NUM_PERM: int = 64
+    PROMPT_CACHE_BANDS: int = 16
+    PROMPT_CACHE_BUCKET_SIZE: int = 50
     
     # Database
     DATABASE_URL: str = "sqlite:///./ai_coding_platform.db"
     
+    # Blob store (생성 파일 내용 주소 저장소)
+    BLOB_STORE_DIR: str = "./data/blobs"
+    
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     
+    # 공유 상태 저장소 (local: 단일 프로세스, redis: 멀티 워커)
+    STATE_BACKEND: str = "local"
+    
+    # 서버
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    WEB_CONCURRENCY: int = 0  # 0이면 CPU 코어 수
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+    
+    # 요청 수용 제어 (경로별 동시 실행 한도 / 마감 시간(초))
+    ADMISSION_QUEUE_FACTOR: int = 2  # 대기열 크기 = 동시 실행 한도 x 배수
+    ADMISSION_QUEUE_TIMEOUT: float = 10.0
+    ADMISSION_TRUSTED_PROXIES: str = ""  # X-Forwarded-For를 신뢰할 프록시 IP (쉼표 구분)
+    FIGMA_TO_CODE_CONCURRENCY: int = 8
+    FIGMA_TO_CODE_DEADLINE: float = 120.0
+    FIGMA_TO_CODE_PER_CLIENT: Optional[int] = None  # 클라이언트별 동시 요청 한도, 미지정 시 동시 실행 한도의 절반
+    CODE_CONCURRENCY: int = 16
+    CODE_DEADLINE: float = 90.0
+    CODE_PER_CLIENT: Optional[int] = None
+    DEPLOY_CONCURRENCY: int = 2
+    DEPLOY_DEADLINE: float = 600.0
+    DEPLOY_PER_CLIENT: Optional[int] = None
+    
+    # 요청 프로파일링 (관리자 토큰이 없으면 헤더 프로파일링/관리자 API 비활성화)
+    PROFILING_ADMIN_TOKEN: Optional[str] = None
+    PROFILING_SAMPLE_RATE: float = 0.0  # 무작위로 프로파일링할 요청 비율
+    PROFILING_SLOW_THRESHOLD: float = 0.0  # 이 시간(초) 이상 걸린 요청은 항상 보관, 0이면 비활성화
+    PROFILING_INTERVAL: float = 0.005
+    PROFILING_BUFFER_SIZE: int = 50
+    
     # JWT
     JWT_SECRET_KEY: str = "your-secret-key"
     JWT_ALGORITHM: str = "HS256"
@@ -28,8 +76,25 @@ class Settings(BaseSettings):
     # Vercel
     VERCEL_TOKEN: Optional[str] = None
     
+    # 배포 빌드 캐시 (의존성/템플릿)
+    BUILD_CACHE_DIR: str = "./data/build-cache"
+    
+    # 배포 상태 조회 (캐시 TTL / 폴링 백오프 간격, 초)
+    DEPLOYMENT_STATUS_TTL: float = 5.0
+    DEPLOYMENT_POLL_MIN_INTERVAL: float = 1.0
+    DEPLOYMENT_POLL_MAX_INTERVAL: float = 30.0
+    DEPLOYMENT_FAKE_PLATFORM: bool = False  # 오프라인 테스트용 "fake" 플랫폼 활성화
+    
     # Figma
     FIGMA_ACCESS_TOKEN: Optional[str] = None
+    FIGMA_NODE_DEPTH: int = 3
+    FIGMA_MAX_DEPTH: int = 12  # 잘린 자식을 지연 로딩할 최대 레벨 (이미 받은 노드는 모두 순회)
+    FIGMA_STREAMING: bool = False  # 메모리 피크는 줄지만 파싱이 느려짐 (benchmarks/figma_stream_memory.py)
+    FIGMA_STREAM_CHUNK_SIZE: int = 65536
+    
+    # Design tokens
+    DESIGN_TOKEN_COLOR_THRESHOLD: float = 2.3
+    DESIGN_TOKEN_SPACING_TOLERANCE: float = 0.5
     
     # OpenAI (백업용)
     OPENAI_API_KEY: Optional[str] = None
@@ -0,0 +1,202 @@
+import asyncio
+import collections
+import contextvars
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.state import state_store
+
+# 보관된 프로파일 namespace (워커 간 공유, 최근 PROFILING_BUFFER_SIZE개만 유지)
+PROFILES = "profiles"
+PROFILE_INDEX = "index"
+
+# 요청 태스크에서 파생된 자식 태스크도 같은 프로파일에 기록하기 위한 컨텍스트
+_current_profile: contextvars.ContextVar = contextvars.ContextVar("current_profile", default=None)
+
+def _running_task(loop) -> Optional[asyncio.Task]:
+    """다른 스레드에서 이벤트 루프가 실행 중인 태스크 조회 (읽기 전용)"""
+    current_tasks = getattr(asyncio.tasks, "_current_tasks", None)
+    return current_tasks.get(loop) if current_tasks is not None else None
+
+def _fold(frame) -> str:
+    """프레임 스택을 flamegraph 'collapsed' 형식의 한 줄로 변환 (루트가 앞)"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+class RequestProfile:
+    """요청 하나의 샘플링 프로파일"""
+
+    def __init__(self, method: str, path: str, reason: Optional[str]):
+        self.id = uuid.uuid4().hex[:16]
+        self.method = method
+        self.path = path
+        self.reason = reason  # header, sampled, slow
+        self.started_at = time.time()
+        self.duration: Optional[float] = None
+        self.stacks: collections.Counter = collections.Counter()
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "reason": self.reason,
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "samples": sum(self.stacks.values())
+        }
+
+    def to_dict(self) -> Dict:
+        return dict(self.summary(), collapsed=self.collapsed())
+
+    def collapsed(self) -> str:
+        """Brendan Gregg collapsed stack 형식 (flamegraph.pl, speedscope 호환)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+class SamplingProfiler:
+    """이벤트 루프 스레드의 스택을 주기적으로 샘플링하여 실행 중인 요청에 기록"""
+
+    def __init__(self, interval: Optional[float] = None, buffer_size: Optional[int] = None):
+        self.interval = interval or settings.PROFILING_INTERVAL
+        self.buffer_size = buffer_size or settings.PROFILING_BUFFER_SIZE
+        self._active: Dict[asyncio.Task, RequestProfile] = {}
+        self._loop = None
+        self._loop_thread_id = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self, profile: RequestProfile):
+        """현재 태스크를 프로파일 대상으로 등록 (요청 처리 태스크에서 호출)"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        _current_profile.set(profile)
+        with self._lock:
+            self._active[asyncio.current_task()] = profile
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def stop(self, profile: RequestProfile):
+        with self._lock:
+            self._active.pop(asyncio.current_task(), None)
+
+    async def save(self, profile: RequestProfile):
+        """완료된 프로파일을 공유 저장소에 보관하고 오래된 항목 정리 (어느 워커에서든 조회 가능)"""
+
+        await state_store.set(PROFILES, profile.id, profile.to_dict())
+        evicted: List[str] = []
+
+        def append(index: Optional[List[str]]) -> List[str]:
+            index = (index or []) + [profile.id]
+            evicted[:] = index[:-self.buffer_size]
+            return index[-self.buffer_size:]
+
+        await state_store.update(PROFILES, PROFILE_INDEX, append)
+        for profile_id in evicted:
+            await state_store.delete(PROFILES, profile_id)
+
+    async def list_profiles(self) -> List[Dict]:
+        """보관 중인 프로파일 요약 (최신순)"""
+        summaries = []
+        for profile_id in reversed(await state_store.get(PROFILES, PROFILE_INDEX) or []):
+            profile = await state_store.get(PROFILES, profile_id)
+            if profile:
+                summaries.append({key: value for key, value in profile.items() if key != "collapsed"})
+        return summaries
+
+    async def get(self, profile_id: str) -> Optional[Dict]:
+        if profile_id == PROFILE_INDEX:
+            return None
+        return await state_store.get(PROFILES, profile_id)
+
+    def _profile_for(self, task) -> Optional[RequestProfile]:
+        profile = self._active.get(task)
+        if profile is None and task is not None and hasattr(task, "get_context"):
+            # Python 3.12+: 요청에서 파생된 자식 태스크
+            profile = task.get_context().get(_current_profile)
+        return profile
+
+    def _run(self):
+        last = time.perf_counter()
+        while True:
+            with self._lock:
+                if not self._active:
+                    # 대상 요청이 없으면 스레드 종료 (다음 요청에서 다시 시작)
+                    self._thread = None
+                    return
+                # GIL을 놓지 않는 긴 C 호출(json.dumps 등) 동안 밀린 샘플만큼 가중치 부여
+                now = time.perf_counter()
+                weight = max(1, round((now - last) / self.interval))
+                last = now
+                task = _running_task(self._loop)
+                profile = self._profile_for(task)
+                if profile is not None:
+                    frame = sys._current_frames().get(self._loop_thread_id)
+                    if frame is not None:
+                        profile.stacks[_fold(frame)] += weight
+            time.sleep(self.interval)
+
+class ProfilingMiddleware:
+    """관리자 헤더 또는 샘플링 비율로 요청을 프로파일링하고, 느린 요청은 항상 보관하는 ASGI 미들웨어"""
+
+    def __init__(self, app, profiler: Optional[SamplingProfiler] = None):
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    def _reason(self, scope) -> Optional[str]:
+        token = settings.PROFILING_ADMIN_TOKEN
+        if token:
+            for name, value in scope.get("headers", []):
+                # 바이트로 비교 (비ASCII 문자열은 compare_digest에서 TypeError)
+                if name == b"x-profile" and hmac.compare_digest(value, token.encode()):
+                    return "header"
+        if settings.PROFILING_SAMPLE_RATE and random.random() < settings.PROFILING_SAMPLE_RATE:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        reason = self._reason(scope)
+        threshold = settings.PROFILING_SLOW_THRESHOLD
+        # 느린 요청 수집이 켜져 있으면 모든 요청을 샘플링하고 끝난 뒤 보관 여부 결정
+        if reason is None and not threshold:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"], reason)
+
+        async def send_with_profile_id(message):
+            if reason == "header" and message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile.id.encode())
+                ]
+            await send(message)
+
+        started = time.perf_counter()
+        self.profiler.start(profile)
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.duration = time.perf_counter() - started
+            slow = bool(threshold) and profile.duration >= threshold
+            if slow and profile.reason is None:
+                profile.reason = "slow"
+            self.profiler.stop(profile)
+            if reason is not None or slow:
+                await self.profiler.save(profile)
+
+request_profiler = SamplingProfiler()
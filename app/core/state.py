@@ -0,0 +1,182 @@
+import heapq
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Union
+from app.core.config import settings
+
+Number = Union[int, float]
+
+class StateStore(ABC):
+    """워커 간 공유 상태 인터페이스 (프로젝트, 배포 작업, 캐시 등)
+
+    값은 JSON 직렬화 가능한 객체여야 하며, namespace별로 key를 구분한다.
+    """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def get_many(self, namespace: str, keys: List[str]) -> List[Optional[Any]]:
+        """여러 key를 한 번에 조회 (keys 순서대로, 없는 key는 None)"""
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        ...
+
+    @abstractmethod
+    async def delete(self, namespace: str, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def values(self, namespace: str) -> List[Any]:
+        ...
+
+    @abstractmethod
+    async def incr(self, namespace: str, key: str, amount: Number = 1) -> Number:
+        ...
+
+    @abstractmethod
+    async def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any],
+                     ttl: Optional[float] = None) -> Any:
+        """현재 값(없으면 None)에 fn을 적용한 결과를 원자적으로 저장하고 반환
+
+        다른 워커가 중간에 값을 바꾸면 fn을 다시 실행하므로 fn은 부작용 없이 재실행 가능해야 한다.
+        """
+
+    async def close(self):
+        pass
+
+class LocalStateStore(StateStore):
+    """단일 프로세스용 메모리 저장소 (개발/테스트용)"""
+
+    def __init__(self):
+        # namespace -> key -> (value, 만료 시각)
+        self._data: Dict[str, Dict[str, tuple]] = {}
+        # (만료 시각, namespace, key) 최소 힙 - 만료된 항목만 꺼내 정리
+        self._expiry: List[tuple] = []
+
+    def _sweep(self):
+        """만료 시각이 지난 항목만 힙에서 꺼내 삭제 (호출당 만료된 개수만큼만 비용)"""
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, namespace, key = heapq.heappop(self._expiry)
+            entries = self._data.get(namespace, {})
+            # 이후 다시 저장된 키는 만료 시각이 달라 남겨둠
+            if key in entries and entries[key][1] == expires:
+                del entries[key]
+
+    def _entries(self, namespace: str) -> Dict[str, tuple]:
+        self._sweep()
+        return self._data.setdefault(namespace, {})
+
+    def _store(self, namespace: str, key: str, value: Any, ttl: Optional[float]):
+        expires = time.monotonic() + ttl if ttl else None
+        self._entries(namespace)[key] = (json.dumps(value, ensure_ascii=False), expires)
+        if expires is not None:
+            heapq.heappush(self._expiry, (expires, namespace, key))
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        entry = self._entries(namespace).get(key)
+        # 호출자가 값을 수정해도 저장된 값에 영향이 없도록 복사본 반환 (Redis와 동일한 의미)
+        return json.loads(entry[0]) if entry else None
+
+    async def get_many(self, namespace: str, keys: List[str]) -> List[Optional[Any]]:
+        entries = self._entries(namespace)
+        return [json.loads(entries[key][0]) if key in entries else None for key in keys]
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        self._store(namespace, key, value, ttl)
+
+    async def delete(self, namespace: str, key: str) -> bool:
+        return self._entries(namespace).pop(key, None) is not None
+
+    async def values(self, namespace: str) -> List[Any]:
+        return [json.loads(value) for value, _ in self._entries(namespace).values()]
+
+    async def incr(self, namespace: str, key: str, amount: Number = 1) -> Number:
+        current = await self.get(namespace, key) or 0
+        await self.set(namespace, key, current + amount)
+        return current + amount
+
+    async def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any],
+                     ttl: Optional[float] = None) -> Any:
+        # 조회와 저장 사이에 await가 없으므로 단일 이벤트 루프 안에서 원자적
+        entry = self._entries(namespace).get(key)
+        value = fn(json.loads(entry[0]) if entry else None)
+        self._store(namespace, key, value, ttl)
+        return value
+
+class RedisStateStore(StateStore):
+    """Redis 기반 저장소 (여러 워커/인스턴스가 같은 상태를 공유)"""
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "outer"):
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url or settings.REDIS_URL, decode_responses=True)
+        self.prefix = prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        value = await self.client.get(self._key(namespace, key))
+        return json.loads(value) if value is not None else None
+
+    async def get_many(self, namespace: str, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        values = await self.client.mget([self._key(namespace, key) for key in keys])
+        return [json.loads(value) if value is not None else None for value in values]
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        await self.client.set(
+            self._key(namespace, key),
+            json.dumps(value, ensure_ascii=False),
+            px=int(ttl * 1000) if ttl else None
+        )
+
+    async def delete(self, namespace: str, key: str) -> bool:
+        return bool(await self.client.delete(self._key(namespace, key)))
+
+    async def values(self, namespace: str) -> List[Any]:
+        keys = [key async for key in self.client.scan_iter(match=self._key(namespace, "*"))]
+        if not keys:
+            return []
+        return [json.loads(value) for value in await self.client.mget(keys) if value is not None]
+
+    async def incr(self, namespace: str, key: str, amount: Number = 1) -> Number:
+        if isinstance(amount, float):
+            return float(await self.client.incrbyfloat(self._key(namespace, key), amount))
+        return await self.client.incrby(self._key(namespace, key), amount)
+
+    async def update(self, namespace: str, key: str, fn: Callable[[Optional[Any]], Any],
+                     ttl: Optional[float] = None) -> Any:
+        from redis.exceptions import WatchError
+
+        redis_key = self._key(namespace, key)
+        async with self.client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    # WATCH 이후 다른 클라이언트가 키를 바꾸면 EXEC가 실패하고 처음부터 다시 시도
+                    await pipe.watch(redis_key)
+                    current = await pipe.get(redis_key)
+                    value = fn(json.loads(current) if current is not None else None)
+                    pipe.multi()
+                    pipe.set(redis_key, json.dumps(value, ensure_ascii=False), px=int(ttl * 1000) if ttl else None)
+                    await pipe.execute()
+                    return value
+                except WatchError:
+                    continue
+
+    async def close(self):
+        await self.client.aclose()
+
+def create_state_store() -> StateStore:
+    """설정(STATE_BACKEND)에 따라 저장소 생성"""
+    if settings.STATE_BACKEND == "redis":
+        return RedisStateStore()
+    return LocalStateStore()
+
+state_store = create_state_store()
@@ -0,0 +1,56 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Optional
+from app.core.config import settings
+
+class BlobStore:
+    """SHA-256 내용 주소 기반 blob 저장소 (같은 내용은 한 번만 저장)"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or settings.BLOB_STORE_DIR
+
+    def _path(self, blob_hash: str) -> str:
+        # 디렉토리당 파일 수를 줄이기 위해 앞 2글자로 분산
+        return os.path.join(self.root, blob_hash[:2], blob_hash[2:])
+
+    def put(self, data: bytes) -> str:
+        """blob 저장 후 해시 반환"""
+        blob_hash = hashlib.sha256(data).hexdigest()
+        path = self._path(blob_hash)
+        if os.path.exists(path):
+            return blob_hash
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 원자적으로 교체 (동시 저장 시에도 내용이 같으므로 안전)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return blob_hash
+
+    def get(self, blob_hash: str) -> bytes:
+        """해시로 blob 조회"""
+        with open(self._path(blob_hash), "rb") as f:
+            return f.read()
+
+    def put_text(self, text: str) -> str:
+        return self.put(text.encode("utf-8"))
+
+    def get_text(self, blob_hash: str) -> str:
+        return self.get(blob_hash).decode("utf-8")
+
+    def put_json(self, value: Any) -> str:
+        """JSON을 정규화(키 정렬)하여 저장 - 같은 값은 항상 같은 해시"""
+        return self.put_text(json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":")))
+
+    def get_json(self, blob_hash: str) -> Any:
+        return json.loads(self.get_text(blob_hash))
+
+blob_store = BlobStore()
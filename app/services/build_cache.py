@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.state import state_store
+
+STATS = "build_cache_stats"
+
+# 프레임워크별 기본 프로젝트 골격 (생성 코드에 없는 파일만 채움)
+TEMPLATES = {
+    "react": {
+        "public/index.html": (
+            "<!DOCTYPE html>\n<html lang=\"en\">\n  <head>\n    <meta charset=\"utf-8\" />\n"
+            "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
+            "    <title>App</title>\n  </head>\n  <body>\n    <div id=\"root\"></div>\n  </body>\n</html>\n"
+        ),
+        "src/index.tsx": (
+            "import React from 'react';\nimport ReactDOM from 'react-dom/client';\nimport App from './App';\n\n"
+            "const root = ReactDOM.createRoot(document.getElementById('root') as HTMLElement);\n"
+            "root.render(\n  <React.StrictMode>\n    <App />\n  </React.StrictMode>\n);\n"
+        ),
+        "tsconfig.json": json.dumps({
+            "compilerOptions": {
+                "target": "es5",
+                "lib": ["dom", "dom.iterable", "esnext"],
+                "allowJs": True,
+                "skipLibCheck": True,
+                "esModuleInterop": True,
+                "strict": True,
+                "module": "esnext",
+                "moduleResolution": "node",
+                "resolveJsonModule": True,
+                "isolatedModules": True,
+                "noEmit": True,
+                "jsx": "react-jsx"
+            },
+            "include": ["src"]
+        }, indent=2),
+        ".vercelignore": "node_modules\n"
+    }
+}
+
+# 패키지 매니저가 설치 단계에서 제자리 수정하는 node_modules 메타데이터
+# (하드링크하면 캐시 원본까지 바뀌므로 항상 복사)
+NODE_MODULES_METADATA = {".package-lock.json", ".yarn-integrity", ".modules.yaml", ".yarn-state.yml"}
+
+def _link_or_copy(src: str, dst: str):
+    """하드링크로 복사 (다른 파일시스템이면 일반 복사)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _link_node_module(src: str, dst: str):
+    """패키지 파일은 하드링크, 패키지 매니저 메타데이터는 복사"""
+    if os.path.basename(src) in NODE_MODULES_METADATA:
+        shutil.copy2(src, dst)
+    else:
+        _link_or_copy(src, dst)
+
+class BuildCacheService:
+    """package.json 의존성 해시 기반 node_modules 캐시와 템플릿 기반 작업 디렉토리 준비"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or settings.BUILD_CACHE_DIR
+
+    def dependency_key(self, package_json: Dict) -> str:
+        """의존성 목록만으로 캐시 키 계산 (스크립트/메타데이터 변경은 무시)"""
+        dependencies = {
+            "dependencies": package_json.get("dependencies", {}),
+            "devDependencies": package_json.get("devDependencies", {})
+        }
+        canonical = json.dumps(dependencies, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def detect_framework(self, package_json: Dict) -> Optional[str]:
+        """package.json 의존성으로 템플릿 프레임워크 추정 (템플릿이 없으면 None)"""
+        dependencies = {**package_json.get("devDependencies", {}), **package_json.get("dependencies", {})}
+        if "react" in dependencies and "next" not in dependencies:
+            return "react"
+        return None
+
+    def template_dir(self, framework: str) -> Optional[str]:
+        """프레임워크 템플릿 디렉토리 (최초 사용 시 생성, 템플릿이 없는 프레임워크는 None)"""
+
+        if framework not in TEMPLATES:
+            return None
+
+        path = os.path.join(self.root, "templates", framework)
+        if os.path.isdir(path):
+            return path
+
+        staging = tempfile.mkdtemp(dir=self._ensure_dir("templates"))
+        for relative_path, content in TEMPLATES[framework].items():
+            file_path = os.path.join(staging, relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "w") as f:
+                f.write(content)
+        self._publish(staging, path)
+        return path
+
+    def prepare_workspace(self, workspace: str, package_json: Dict, framework: Optional[str] = None) -> Dict:
+        """템플릿과 캐시된 node_modules를 작업 디렉토리에 링크하고 캐시 결과 반환"""
+
+        started = time.perf_counter()
+        os.makedirs(workspace, exist_ok=True)
+        # 템플릿이 없는 프레임워크는 생성된 파일만 사용 (다른 프레임워크 골격을 섞지 않음)
+        template = self.template_dir(framework) if framework else None
+        if template:
+            shutil.copytree(template, workspace, copy_function=_link_or_copy, dirs_exist_ok=True)
+
+        key = self.dependency_key(package_json)
+        cache_dir = os.path.join(self.root, "deps", key)
+        hit = os.path.isdir(os.path.join(cache_dir, "node_modules"))
+        if not hit:
+            self._install(cache_dir, package_json)
+
+        # 패키지 파일은 하드링크 (빌드 중 수정되지 않음), npm 등이 다시 쓰는 메타데이터는 복사
+        shutil.copytree(os.path.join(cache_dir, "node_modules"), os.path.join(workspace, "node_modules"),
+                        copy_function=_link_node_module, symlinks=True, dirs_exist_ok=True)
+
+        elapsed = time.perf_counter() - started
+        install_seconds = self._read_meta(cache_dir).get("install_seconds", 0.0)
+        saved = max(install_seconds - elapsed, 0.0) if hit else 0.0
+
+        return {
+            "key": key,
+            "hit": hit,
+            "seconds": round(elapsed, 3),
+            "seconds_saved": round(saved, 3)
+        }
+
+    def vercel_command(self) -> List[str]:
+        """캐시에 설치된 Vercel CLI 경로 (매번 npx로 내려받지 않도록 최초 1회 설치)"""
+
+        tools_dir = os.path.join(self.root, "tools")
+        binary = os.path.join(tools_dir, "node_modules", ".bin", "vercel")
+        if not os.path.exists(binary):
+            staging = tempfile.mkdtemp(dir=self._ensure_dir("deps"))
+            result = subprocess.run([
+                "npm", "install", "--prefix", staging, "--no-audit", "--no-fund",
+                "--cache", self._ensure_dir("npm"), "vercel"
+            ], capture_output=True, text=True)
+            if result.returncode != 0:
+                shutil.rmtree(staging, ignore_errors=True)
+                return ["npx", "vercel"]
+            self._publish(staging, tools_dir)
+        return [binary]
+
+    async def record_build(self, result: Dict):
+        """빌드 캐시 결과를 공유 통계에 반영 (워커 간 합산)"""
+        await state_store.incr(STATS, "builds")
+        await state_store.incr(STATS, "hits" if result["hit"] else "misses")
+        await state_store.incr(STATS, "seconds_saved", float(result["seconds_saved"]))
+
+    async def get_stats(self) -> Dict:
+        stats = {
+            key: await state_store.get(STATS, key) or 0
+            for key in ("builds", "hits", "misses", "seconds_saved")
+        }
+        builds = stats["builds"]
+        return {
+            **stats,
+            "seconds_saved": round(float(stats["seconds_saved"]), 3),
+            "hit_rate": stats["hits"] / builds if builds else 0.0
+        }
+
+    def _install(self, cache_dir: str, package_json: Dict):
+        """의존성 설치 후 캐시에 등록 (공유 npm 캐시 사용)"""
+
+        staging = tempfile.mkdtemp(dir=self._ensure_dir("deps"))
+        with open(os.path.join(staging, "package.json"), "w") as f:
+            json.dump({
+                "name": "build-cache",
+                "private": True,
+                "dependencies": package_json.get("dependencies", {}),
+                "devDependencies": package_json.get("devDependencies", {})
+            }, f, indent=2)
+
+        started = time.perf_counter()
+        result = subprocess.run([
+            "npm", "install", "--prefer-offline", "--no-audit", "--no-fund",
+            "--cache", self._ensure_dir("npm")
+        ], cwd=staging, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise Exception(f"npm install failed: {result.stderr}")
+
+        # 의존성이 없어도 링크할 디렉토리는 있어야 함
+        os.makedirs(os.path.join(staging, "node_modules"), exist_ok=True)
+
+        with open(os.path.join(staging, "cache.json"), "w") as f:
+            json.dump({"install_seconds": time.perf_counter() - started}, f)
+        self._publish(staging, cache_dir)
+
+    def _read_meta(self, cache_dir: str) -> Dict:
+        try:
+            with open(os.path.join(cache_dir, "cache.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _publish(self, staging: str, path: str):
+        """준비된 디렉토리를 원자적으로 캐시에 등록 (동시에 만들어졌다면 버림)"""
+        try:
+            os.rename(staging, path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _ensure_dir(self, name: str) -> str:
+        path = os.path.join(self.root, name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+build_cache_service = BuildCacheService()
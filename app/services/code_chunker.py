@@ -0,0 +1,162 @@
+import re
+from typing import Dict, List
+
+# 다른 청크에도 공유해야 하는 최상위 선언 (import/타입 선언)
+CONTEXT_PATTERN = re.compile(
+    r"^(import\s|from\s+\S+\s+import\s|export\s+(type|interface)\s|type\s+\w+|interface\s|declare\s|['\"]use \w+['\"])"
+)
+# 다음 선언에 붙는 줄 (주석/데코레이터)
+ATTACHED_PATTERN = re.compile(r"^(//|/\*|\*|#|@)")
+
+CHARS_PER_TOKEN = 4
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (API 호출 없이 문자 수 기준)"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+# 닫는 괄호로 닫히는 상태 ("${"는 템플릿 리터럴 안의 표현식)
+OPEN_BRACKETS = ("(", "[", "{", "${")
+
+def _scan_line(line: str, stack: List[str]) -> List[str]:
+    """한 줄을 읽으며 열린 괄호/문자열/템플릿 리터럴/블록 주석 상태를 갱신
+
+    stack이 비어 있을 때 시작하는 줄만 최상위 선언 경계가 될 수 있다.
+    """
+
+    i = 0
+    while i < len(line):
+        top = stack[-1] if stack else None
+        char = line[i]
+
+        if top == "/*":
+            if line.startswith("*/", i):
+                stack.pop()
+                i += 2
+            else:
+                i += 1
+        elif top in ('"""', "'''"):
+            if char == "\\":
+                i += 2
+            elif line.startswith(top, i):
+                stack.pop()
+                i += 3
+            else:
+                i += 1
+        elif top in ("'", '"', "`"):
+            if char == "\\":
+                i += 2
+                continue
+            if char == top:
+                stack.pop()
+            elif top == "`" and line.startswith("${", i):
+                stack.append("${")
+                i += 1
+            i += 1
+        elif line.startswith("//", i) or (char == "#" and not line[:i].strip()):
+            break
+        elif line.startswith("/*", i):
+            stack.append("/*")
+            i += 2
+        elif line.startswith('"""', i) or line.startswith("'''", i):
+            stack.append(line[i:i + 3])
+            i += 3
+        elif char in "'\"`([{":
+            stack.append(char)
+            i += 1
+        elif char in ")]}":
+            if top in OPEN_BRACKETS:
+                stack.pop()
+            i += 1
+        else:
+            i += 1
+
+    # 따옴표 문자열은 줄을 넘지 않음 (JSX 텍스트의 아포스트로피 등)
+    while stack and stack[-1] in ("'", '"'):
+        stack.pop()
+    return stack
+
+def split_segments(code: str) -> List[Dict]:
+    """최상위 함수/컴포넌트/선언 경계로 코드를 분할"""
+
+    result = []
+    current: List[str] = []
+    first_code_line = ""  # 주석/데코레이터를 제외한 현재 세그먼트의 첫 줄 (비어 있으면 헤더만 있음)
+    stack: List[str] = []  # 줄 시작 시점의 열린 괄호/문자열 상태
+
+    def flush():
+        result.append({
+            "code": "".join(current),
+            "context": bool(CONTEXT_PATTERN.match(first_code_line))
+        })
+
+    for line in code.splitlines(keepends=True):
+        stripped = line.strip()
+        is_top_level = (
+            not stack and bool(stripped) and not line[0].isspace() and line[0] not in "})]"
+        )
+        in_comment = bool(stack) and stack[-1] == "/*"
+        stack = _scan_line(line, stack)
+
+        if is_top_level and current and first_code_line:
+            flush()
+            current = []
+            first_code_line = ""
+
+        current.append(line)
+        if stripped and not first_code_line and not in_comment and not ATTACHED_PATTERN.match(stripped):
+            first_code_line = stripped
+
+    if current:
+        flush()
+
+    return result
+
+def build_chunks(code: str, max_tokens: int) -> Dict:
+    """세그먼트를 토큰 한도 내로 묶고, 공유 컨텍스트와 원래 순서를 함께 반환
+
+    반환값의 parts는 원래 순서대로 ("context", 코드) 또는 ("chunk", 청크 인덱스) 항목을 가진다.
+    """
+
+    context = []
+    chunks: List[str] = []
+    parts = []
+    buffer = ""
+
+    def flush():
+        nonlocal buffer
+        if buffer:
+            parts.append(("chunk", len(chunks)))
+            chunks.append(buffer)
+            buffer = ""
+
+    for segment in split_segments(code):
+        if segment["context"]:
+            flush()
+            context.append(segment["code"])
+            parts.append(("context", segment["code"]))
+            continue
+
+        # 한 세그먼트가 한도를 넘으면 단독 청크로 보냄
+        if buffer and estimate_tokens(buffer + segment["code"]) > max_tokens:
+            flush()
+        buffer += segment["code"]
+    flush()
+
+    return {
+        "context": "".join(context),
+        "chunks": chunks,
+        "parts": parts
+    }
+
+def stitch(parts: List, results: List[str]) -> str:
+    """처리된 청크를 원래 순서대로 다시 조립"""
+    output = []
+    for kind, value in parts:
+        text = value if kind == "context" else results[value]
+        output.append(text if text.endswith("\n") else text + "\n")
+    return "".join(output)
+
+def strip_code_fence(text: str) -> str:
+    """모델 응답의 마크다운 코드 블록 제거"""
+    match = re.match(r"^\s*```[\w+-]*\n(.*?)\n?```\s*$", text, re.DOTALL)
+    return match.group(1) if match else text
@@ -1,9 +1,12 @@
+import asyncio
 import httpx
 import json
 import os
-import subprocess
+import shutil
+import tempfile
 from typing import Dict, List, Optional
 from app.core.config import settings
+from app.services.build_cache import build_cache_service
 
 class DeploymentService:
     def __init__(self):
@@ -12,66 +15,62 @@ class DeploymentService:
     async def deploy_to_vercel(self, project_data: Dict, project_name: str) -> Dict:
         """Vercel에 프로젝트 배포"""
         
+        # vercel pull은 연결되지 않은 디렉토리를 디렉토리 이름의 프로젝트에 연결하므로
+        # 임시 상위 디렉토리 아래 project_name으로 작업 디렉토리를 만들어 이름을 고정
+        parent = tempfile.mkdtemp(prefix="outer-deploy-")
+        workspace = os.path.join(parent, project_name)
         try:
-            # 임시 디렉토리 생성
-            temp_dir = f"/tmp/{project_name}"
-            os.makedirs(temp_dir, exist_ok=True)
-            
-            # package.json 생성
+            # 템플릿과 캐시된 의존성으로 작업 디렉토리 준비
             package_json = project_data.get("package_json", {})
-            with open(f"{temp_dir}/package.json", "w") as f:
-                json.dump(package_json, f, indent=2)
-            
-            # 메인 파일 생성
-            main_file = project_data.get("main_file", "")
-            with open(f"{temp_dir}/src/App.tsx", "w") as f:
-                f.write(main_file)
-            
-            # 컴포넌트 파일들 생성
-            components = project_data.get("components", [])
-            for component in components:
-                component_name = component["name"]
-                component_code = component["code"]
-                with open(f"{temp_dir}/src/components/{component_name}.tsx", "w") as f:
-                    f.write(component_code)
+            framework = project_data.get("framework") or build_cache_service.detect_framework(package_json)
+            cache_result = await asyncio.to_thread(
+                build_cache_service.prepare_workspace, workspace, package_json, framework
+            )
+            await build_cache_service.record_build(cache_result)
             
-            # README 생성
-            readme = project_data.get("readme", "")
-            with open(f"{temp_dir}/README.md", "w") as f:
-                f.write(readme)
+            # 생성된 파일들로 덮어쓰기
+            await self._create_project_files(workspace, project_data)
             
-            # Vercel CLI 설치 및 배포
-            result = subprocess.run([
-                "npx", "vercel", "--token", self.vercel_token,
-                "--yes", "--prod"
-            ], cwd=temp_dir, capture_output=True, text=True)
+            # 로컬에서 빌드 후 결과물만 업로드 (원격 빌드의 의존성 설치 생략)
+            vercel = await asyncio.to_thread(build_cache_service.vercel_command)
+            token = ["--token", self.vercel_token]
+            for step in (
+                ["pull", "--yes", "--environment=production"],
+                ["build", "--prod"],
+                ["deploy", "--prebuilt", "--prod"]
+            ):
+                returncode, stdout, stderr = await self._run_command(vercel + step + token, workspace)
+                if returncode != 0:
+                    return {
+                        "success": False,
+                        "error": stderr,
+                        "build_cache": cache_result
+                    }
             
-            if result.returncode == 0:
-                # 배포 URL 추출
-                deployment_url = self._extract_vercel_url(result.stdout)
-                return {
-                    "success": True,
-                    "url": deployment_url,
-                    "project_id": project_name
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": result.stderr
-                }
+            # 배포 URL 추출
+            deployment_url = self._extract_vercel_url(stdout)
+            return {
+                "success": True,
+                "url": deployment_url,
+                "project_id": project_name,
+                "build_cache": cache_result
+            }
                 
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            shutil.rmtree(parent, ignore_errors=True)
     
     async def deploy_to_github_pages(self, project_data: Dict, repo_name: str) -> Dict:
         """GitHub Pages에 배포"""
         
         try:
             # GitHub 저장소 생성
-            repo_url = await self._create_github_repo(repo_name)
+            repo = await self._create_github_repo(repo_name)
+            repo_url = repo["clone_url"]
             
             # 로컬 저장소 초기화
             temp_dir = f"/tmp/{repo_name}"
@@ -81,20 +80,21 @@ class DeploymentService:
             await self._create_project_files(temp_dir, project_data)
             
             # Git 초기화 및 푸시
-            subprocess.run(["git", "init"], cwd=temp_dir)
-            subprocess.run(["git", "add", "."], cwd=temp_dir)
-            subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=temp_dir)
-            subprocess.run(["git", "branch", "-M", "main"], cwd=temp_dir)
-            subprocess.run(["git", "remote", "add", "origin", repo_url], cwd=temp_dir)
-            subprocess.run(["git", "push", "-u", "origin", "main"], cwd=temp_dir)
+            await self._run_command(["git", "init"], temp_dir)
+            await self._run_command(["git", "add", "."], temp_dir)
+            await self._run_command(["git", "commit", "-m", "Initial commit"], temp_dir)
+            await self._run_command(["git", "branch", "-M", "main"], temp_dir)
+            await self._run_command(["git", "remote", "add", "origin", repo_url], temp_dir)
+            await self._run_command(["git", "push", "-u", "origin", "main"], temp_dir)
             
             # GitHub Pages 활성화
-            pages_url = await self._enable_github_pages(repo_name)
+            pages_url = await self._enable_github_pages(repo["full_name"])
             
             return {
                 "success": True,
                 "url": pages_url,
-                "repo_url": repo_url
+                "repo_url": repo_url,
+                "repo_full_name": repo["full_name"]
             }
             
         except Exception as e:
@@ -103,8 +103,8 @@ class DeploymentService:
                 "error": str(e)
             }
     
-    async def _create_github_repo(self, repo_name: str) -> str:
-        """GitHub 저장소 생성"""
+    async def _create_github_repo(self, repo_name: str) -> Dict:
+        """GitHub 저장소 생성 (clone_url, full_name(owner/repo) 등 저장소 정보 반환)"""
         
         headers = {
             "Authorization": f"token {settings.GITHUB_CLIENT_SECRET}",
@@ -126,12 +126,12 @@ class DeploymentService:
             )
             
             if response.status_code == 201:
-                return response.json()["clone_url"]
+                return response.json()
             else:
                 raise Exception(f"GitHub repo creation failed: {response.text}")
     
-    async def _enable_github_pages(self, repo_name: str) -> str:
-        """GitHub Pages 활성화"""
+    async def _enable_github_pages(self, full_name: str) -> str:
+        """GitHub Pages 활성화 (full_name은 owner/repo)"""
         
         headers = {
             "Authorization": f"token {settings.GITHUB_CLIENT_SECRET}",
@@ -147,13 +147,14 @@ class DeploymentService:
         
         async with httpx.AsyncClient() as client:
             response = await client.post(
-                f"https://api.github.com/repos/{repo_name}/pages",
+                f"https://api.github.com/repos/{full_name}/pages",
                 headers=headers,
                 json=data
             )
             
             if response.status_code == 201:
-                return f"https://{repo_name}.github.io"
+                owner, repo_name = full_name.split("/", 1)
+                return f"https://{owner}.github.io/{repo_name}"
             else:
                 raise Exception(f"GitHub Pages activation failed: {response.text}")
     
@@ -162,14 +163,12 @@ class DeploymentService:
         
         # package.json
         package_json = project_data.get("package_json", {})
-        with open(f"{temp_dir}/package.json", "w") as f:
-            json.dump(package_json, f, indent=2)
+        self._write_file(f"{temp_dir}/package.json", json.dumps(package_json, indent=2))
         
         # 메인 파일
         main_file = project_data.get("main_file", "")
         os.makedirs(f"{temp_dir}/src", exist_ok=True)
-        with open(f"{temp_dir}/src/App.tsx", "w") as f:
-            f.write(main_file)
+        self._write_file(f"{temp_dir}/src/App.tsx", main_file)
         
         # 컴포넌트들
         components = project_data.get("components", [])
@@ -177,13 +176,34 @@ class DeploymentService:
         for component in components:
             component_name = component["name"]
             component_code = component["code"]
-            with open(f"{temp_dir}/src/components/{component_name}.tsx", "w") as f:
-                f.write(component_code)
+            self._write_file(f"{temp_dir}/src/components/{component_name}.tsx", component_code)
         
         # README
         readme = project_data.get("readme", "")
-        with open(f"{temp_dir}/README.md", "w") as f:
-            f.write(readme)
+        self._write_file(f"{temp_dir}/README.md", readme)
+    
+    def _write_file(self, path: str, content: str):
+        """파일 쓰기 (템플릿에서 하드링크된 파일은 원본이 바뀌지 않도록 먼저 끊음)"""
+        if os.path.exists(path):
+            os.remove(path)
+        with open(path, "w") as f:
+            f.write(content)
+    
+    async def _run_command(self, command: List[str], cwd: str):
+        """비동기 서브프로세스 실행 (요청이 취소되면 프로세스도 종료)"""
+        
+        process = await asyncio.create_subprocess_exec(
+            *command, cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
     
     def _extract_vercel_url(self, output: str) -> str:
         """Vercel CLI 출력에서 URL 추출"""
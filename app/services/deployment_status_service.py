@@ -0,0 +1,283 @@
+import asyncio
+import httpx
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+from app.core.config import settings
+from app.core.state import state_store
+
+# 배포 기록 / 상태 캐시 namespace
+DEPLOYMENTS = "deployments"
+STATUS_CACHE = "deployment_status"
+
+# 더 이상 바뀌지 않는 상태
+TERMINAL_STATUSES = {"deployed", "failed", "canceled", "deleted"}
+
+class VercelStatusClient:
+    """Vercel 배포 상태 조회/삭제"""
+
+    READY_STATES = {
+        "QUEUED": "building",
+        "INITIALIZING": "building",
+        "BUILDING": "building",
+        "READY": "deployed",
+        "ERROR": "failed",
+        "CANCELED": "canceled"
+    }
+
+    def __init__(self):
+        self.base_url = "https://api.vercel.com"
+
+    def _headers(self) -> Dict:
+        return {"Authorization": f"Bearer {settings.VERCEL_TOKEN}"}
+
+    async def get_status(self, deployment_id: str) -> str:
+        # deployment_id는 배포 ID 또는 배포 URL 호스트명
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{self.base_url}/v13/deployments/{deployment_id}",
+                headers=self._headers()
+            )
+            response.raise_for_status()
+            state = response.json().get("readyState", "")
+        return self.READY_STATES.get(state, "unknown")
+
+    async def delete(self, deployment_id: str):
+        # 삭제 API의 경로는 배포 ID만 받으므로 호스트명은 url 파라미터로 전달 (지정 시 경로의 ID는 무시됨)
+        params = {} if deployment_id.startswith("dpl_") else {"url": deployment_id}
+        async with httpx.AsyncClient() as client:
+            response = await client.delete(
+                f"{self.base_url}/v13/deployments/{deployment_id}",
+                headers=self._headers(),
+                params=params
+            )
+            response.raise_for_status()
+
+class GitHubPagesStatusClient:
+    """GitHub Pages 빌드 상태 조회/비활성화"""
+
+    BUILD_STATES = {
+        "queued": "building",
+        "building": "building",
+        "built": "deployed",
+        "errored": "failed"
+    }
+
+    def _headers(self) -> Dict:
+        return {
+            "Authorization": f"token {settings.GITHUB_CLIENT_SECRET}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+
+    async def get_status(self, repo_name: str) -> str:
+        # repo_name은 owner/repo 형식의 전체 이름
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"https://api.github.com/repos/{repo_name}/pages/builds/latest",
+                headers=self._headers()
+            )
+            response.raise_for_status()
+            state = response.json().get("status", "")
+        return self.BUILD_STATES.get(state, "unknown")
+
+    async def delete(self, repo_name: str):
+        async with httpx.AsyncClient() as client:
+            response = await client.delete(
+                f"https://api.github.com/repos/{repo_name}/pages",
+                headers=self._headers()
+            )
+            response.raise_for_status()
+
+class FakePlatformClient:
+    """오프라인 테스트용 가짜 배포 플랫폼
+
+    배포별로 지정한 상태 순서를 조회할 때마다 하나씩 진행하며, 마지막 상태에서 멈춘다.
+    """
+
+    def __init__(self, sequence: Optional[List[str]] = None):
+        self.sequence = sequence or ["building", "building", "deployed"]
+        self.scripts: Dict[str, List[str]] = {}
+        self.calls: Dict[str, int] = {}
+
+    def script(self, deployment_id: str, statuses: List[str]):
+        self.scripts[deployment_id] = list(statuses)
+        self.calls[deployment_id] = 0
+
+    async def get_status(self, deployment_id: str) -> str:
+        statuses = self.scripts.setdefault(deployment_id, list(self.sequence))
+        index = self.calls.get(deployment_id, 0)
+        self.calls[deployment_id] = index + 1
+        return statuses[min(index, len(statuses) - 1)]
+
+    async def delete(self, deployment_id: str):
+        self.scripts[deployment_id] = ["deleted"]
+
+class DeploymentStatusService:
+    """배포 상태 조회 (짧은 TTL 캐시 + 단일 업스트림 폴링 + 구독자 푸시)"""
+
+    def __init__(self, platforms: Optional[Dict] = None):
+        self.platforms = platforms if platforms is not None else {
+            "vercel": VercelStatusClient(),
+            "github-pages": GitHubPagesStatusClient()
+        }
+        if platforms is None and settings.DEPLOYMENT_FAKE_PLATFORM:
+            self.platforms["fake"] = FakePlatformClient()
+        # 프로세스 내 진행 중인 조회/폴러/구독자
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    def _client(self, platform: str):
+        if platform not in self.platforms:
+            raise ValueError(f"Unsupported platform: {platform}")
+        return self.platforms[platform]
+
+    def _cache_key(self, platform: str, deployment_id: str) -> str:
+        return f"{platform}:{deployment_id}"
+
+    async def record_deployment(self, project_id: str, platform: str, deployment_id: str, url: Optional[str] = None):
+        """배포 요청 결과 기록 (상태 조회 시 플랫폼 배포 ID로 변환)"""
+        now = datetime.now().isoformat()
+        await state_store.set(DEPLOYMENTS, project_id, {
+            "id": project_id,
+            "project_name": project_id,
+            "platform": platform,
+            "deployment_id": deployment_id,
+            "url": url,
+            "status": "building",
+            "created_at": now,
+            "updated_at": now
+        })
+
+    async def list_deployments(self) -> List[Dict]:
+        return await state_store.values(DEPLOYMENTS)
+
+    async def resolve(self, project_id: str, platform: str):
+        """(플랫폼, 플랫폼 배포 ID) 조회 - 기록이 없으면 project_id를 그대로 사용"""
+        record = await state_store.get(DEPLOYMENTS, project_id)
+        if record:
+            return record["platform"], record["deployment_id"]
+        return platform, project_id
+
+    async def get_status(self, platform: str, deployment_id: str, max_age: Optional[float] = None) -> Dict:
+        """캐시된 상태를 반환하고, 만료되었으면 업스트림에서 한 번만 조회"""
+
+        key = self._cache_key(platform, deployment_id)
+        cached = await state_store.get(STATUS_CACHE, key)
+        if cached and (max_age is None or self._age(cached) <= max_age):
+            return cached
+
+        # 동시에 들어온 조회는 하나의 업스트림 요청을 공유
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(platform, deployment_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, platform: str, deployment_id: str) -> Dict:
+        status = await self._client(platform).get_status(deployment_id)
+        result = {
+            "platform": platform,
+            "deployment_id": deployment_id,
+            "status": status,
+            "last_updated": datetime.now().isoformat()
+        }
+        ttl = settings.DEPLOYMENT_STATUS_TTL
+        # 종료 상태는 바뀌지 않으므로 오래 캐시
+        if status in TERMINAL_STATUSES:
+            ttl = settings.DEPLOYMENT_STATUS_TTL * 60
+        await state_store.set(STATUS_CACHE, self._cache_key(platform, deployment_id), result, ttl=ttl)
+        return result
+
+    def _age(self, status: Dict) -> float:
+        return (datetime.now() - datetime.fromisoformat(status["last_updated"])).total_seconds()
+
+    async def delete(self, platform: str, deployment_id: str, project_id: Optional[str] = None):
+        await self._client(platform).delete(deployment_id)
+        key = self._cache_key(platform, deployment_id)
+        await state_store.delete(STATUS_CACHE, key)
+        if project_id:
+            await state_store.delete(DEPLOYMENTS, project_id)
+        self._publish(key, {
+            "platform": platform,
+            "deployment_id": deployment_id,
+            "status": "deleted",
+            "last_updated": datetime.now().isoformat()
+        })
+
+    async def subscribe(self, platform: str, deployment_id: str) -> AsyncIterator[Dict]:
+        """상태가 바뀔 때마다 이벤트 전달 (종료 상태에서 끝남)"""
+
+        key = self._cache_key(platform, deployment_id)
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(key, []).append(queue)
+        if key not in self._pollers:
+            self._pollers[key] = asyncio.ensure_future(self._poll(platform, deployment_id))
+
+        try:
+            # 현재 상태를 먼저 전달 (캐시 사용)
+            try:
+                queue.put_nowait(await self.get_status(platform, deployment_id))
+            except Exception:
+                pass
+
+            last_status = None
+            while True:
+                event = await queue.get()
+                # 폴러가 이미 알린 상태는 새 구독자에게 다시 보내지 않도록 중복 제거
+                if event["status"] == last_status:
+                    continue
+                last_status = event["status"]
+                yield event
+                if last_status in TERMINAL_STATUSES:
+                    return
+        finally:
+            subscribers = self._subscribers.get(key, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+            if not subscribers:
+                self._subscribers.pop(key, None)
+                poller = self._pollers.pop(key, None)
+                if poller:
+                    poller.cancel()
+
+    async def _poll(self, platform: str, deployment_id: str):
+        """구독자가 있는 동안 지수 백오프로 상태 조회 (변화가 있으면 간격 초기화)"""
+
+        key = self._cache_key(platform, deployment_id)
+        interval = settings.DEPLOYMENT_POLL_MIN_INTERVAL
+        last_status = None
+
+        try:
+            while self._subscribers.get(key):
+                try:
+                    # 폴링 간격보다 오래된 캐시는 쓰지 않음
+                    result = await self.get_status(platform, deployment_id, max_age=interval)
+                except Exception as e:
+                    result = {
+                        "platform": platform,
+                        "deployment_id": deployment_id,
+                        "status": "unknown",
+                        "error": str(e),
+                        "last_updated": datetime.now().isoformat()
+                    }
+
+                if result["status"] != last_status:
+                    last_status = result["status"]
+                    self._publish(key, result)
+                    interval = settings.DEPLOYMENT_POLL_MIN_INTERVAL
+                else:
+                    interval = min(interval * 2, settings.DEPLOYMENT_POLL_MAX_INTERVAL)
+
+                if last_status in TERMINAL_STATUSES:
+                    return
+                await asyncio.sleep(interval)
+        finally:
+            if self._pollers.get(key) is asyncio.current_task():
+                del self._pollers[key]
+
+    def _publish(self, key: str, event: Dict):
+        for queue in self._subscribers.get(key, []):
+            queue.put_nowait(event)
+
+deployment_status_service = DeploymentStatusService()
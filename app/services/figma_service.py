@@ -1,26 +1,160 @@
+import asyncio
 import httpx
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from app.core.config import settings
+from app.services.figma_stream import parse_stream
+from app.services.token_normalizer import token_normalizer
+
+# 지연 로딩 시 nodes 엔드포인트 요청 하나에 담을 노드 ID 수
+NODE_BATCH_SIZE = 100
+
+SPACING_KEYS = ("itemSpacing", "paddingLeft", "paddingRight", "paddingTop", "paddingBottom")
+
+# depth 경계에서 자식이 잘렸을 수 있는 노드 타입
+CONTAINER_TYPES = {
+    "DOCUMENT", "CANVAS", "FRAME", "GROUP", "SECTION", "COMPONENT",
+    "COMPONENT_SET", "INSTANCE", "BOOLEAN_OPERATION"
+}
+
+class FigmaSubtree:
+    """노드 단위로 가져온 피그마 서브트리 (depth 경계 아래 자식은 지연 로딩)"""
+    
+    def __init__(self, data: Dict, service: Optional["FigmaService"] = None,
+                 file_key: Optional[str] = None, depth: Optional[int] = None,
+                 streaming: bool = False):
+        self.data = data
+        self.service = service
+        self.file_key = file_key
+        self.depth = depth
+        # 지연 로딩 요청도 처음 요청과 같은 파싱 모드 사용
+        self.streaming = streaming
+        # node_id -> (노드, 루트 기준 레벨)
+        self._pending: Dict[str, Tuple[Dict, int]] = {}
+        
+        if depth is not None and "document" in data:
+            self._mark_boundary(data["document"], 0, depth)
+    
+    def _mark_boundary(self, node: Dict, level: int, boundary: int):
+        """depth 경계에 걸린 컨테이너 노드를 지연 로딩 대상으로 등록"""
+        if "children" in node:
+            for child in node["children"]:
+                self._mark_boundary(child, level + 1, boundary)
+        elif level >= boundary and node.get("type") in CONTAINER_TYPES:
+            self._pending[node["id"]] = (node, level)
+    
+    async def load(self, max_depth: Optional[int] = None):
+        """max_depth 레벨까지 잘린 자식을 레벨 단위로 모아 nodes 엔드포인트로 한 번에 가져옴"""
+        
+        while True:
+            ready = [
+                (node_id, node, level)
+                for node_id, (node, level) in self._pending.items()
+                if max_depth is None or level < max_depth
+            ]
+            if not ready:
+                return
+            
+            for start in range(0, len(ready), NODE_BATCH_SIZE):
+                batch = ready[start:start + NODE_BATCH_SIZE]
+                loaded = await self.service.get_node_documents(
+                    self.file_key, [node_id for node_id, _, _ in batch], self.depth, self.streaming
+                )
+                for node_id, node, level in batch:
+                    del self._pending[node_id]
+                    document = loaded.get(node_id) or {}
+                    node["children"] = document.get("children", [])
+                    for child in node["children"]:
+                        self._mark_boundary(child, level + 1, level + self.depth)
+    
+    @property
+    def truncated(self) -> bool:
+        """depth 경계 아래 아직 가져오지 않은 자식이 남아 있는지"""
+        return bool(self._pending)
+    
+    async def children(self, node: Dict, max_depth: Optional[int] = None) -> List[Dict]:
+        """노드의 자식 반환 (max_depth 레벨 미만에서 잘린 노드면 nodes 엔드포인트로 가져옴)
+        
+        max_depth는 지연 로딩만 제한하며, 이미 메모리에 있는 자식은 항상 반환한다.
+        """
+        
+        pending = self._pending.get(node.get("id"))
+        if pending is not None:
+            _, level = pending
+            if max_depth is None or level < max_depth:
+                await self.load(level + 1)
+        
+        return node.get("children", [])
 
 class FigmaService:
     def __init__(self):
         self.access_token = settings.FIGMA_ACCESS_TOKEN
         self.base_url = "https://api.figma.com/v1"
         
-    async def get_file_data(self, file_key: str, node_id: Optional[str] = None) -> Dict:
-        """피그마 파일 데이터 가져오기"""
+    async def get_file_data(self, file_key: str, node_id: Optional[str] = None,
+                            depth: Optional[int] = None, streaming: bool = False,
+                            max_depth: Optional[int] = None) -> Dict:
+        """피그마 파일 데이터 가져오기 (node_id가 있으면 해당 서브트리만, max_depth 레벨까지 로딩)"""
+        
+        if node_id:
+            subtree = await self.get_node_subtree(file_key, node_id, depth, streaming)
+            await subtree.load(settings.FIGMA_MAX_DEPTH if max_depth is None else max_depth)
+            return subtree.data
+        
+        url = f"{self.base_url}/files/{file_key}"
+        return await self._get_json(url, streaming=streaming)
+    
+    async def get_node_subtree(self, file_key: str, node_id: str,
+                               depth: Optional[int] = None, streaming: bool = False) -> FigmaSubtree:
+        """선택한 노드의 서브트리를 depth만큼 가져오기"""
+        
+        if depth is None:
+            depth = settings.FIGMA_NODE_DEPTH
+        
+        url = f"{self.base_url}/files/{file_key}/nodes"
+        params = {"ids": node_id, "depth": depth}
+        payload = await self._get_json(url, params, streaming)
+        
+        node = (payload.get("nodes") or {}).get(node_id) or {}
+        data = {
+            "name": payload.get("name"),
+            "lastModified": payload.get("lastModified"),
+            "version": payload.get("version"),
+            "document": node.get("document", {}),
+            "components": node.get("components", {}),
+            "styles": node.get("styles", {})
+        }
+        
+        return FigmaSubtree(data, self, file_key, depth, streaming)
+    
+    async def get_node_documents(self, file_key: str, node_ids: List[str], depth: int,
+                                 streaming: bool = False) -> Dict[str, Dict]:
+        """여러 노드의 document를 depth만큼 가져오기 (지연 로딩용)"""
+        
+        url = f"{self.base_url}/files/{file_key}/nodes"
+        params = {"ids": ",".join(node_ids), "depth": depth}
+        payload = await self._get_json(url, params, streaming)
+        nodes = payload.get("nodes") or {}
+        
+        return {
+            key: value.get("document", {})
+            for key, value in nodes.items()
+            if value
+        }
+    
+    async def _get_json(self, url: str, params: Optional[Dict] = None, streaming: bool = False) -> Dict:
+        """GET 요청 후 JSON 파싱 (streaming이면 응답을 청크 단위로 파싱하며 불필요한 필드를 버림)"""
         
         headers = {
             "X-Figma-Token": self.access_token
         }
         
-        url = f"{self.base_url}/files/{file_key}"
-        if node_id:
-            url += f"?ids={node_id}"
-            
         async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            return response.json()
+            if not streaming:
+                response = await client.get(url, headers=headers, params=params)
+                return response.json()
+            
+            async with client.stream("GET", url, headers=headers, params=params) as response:
+                return await parse_stream(response.aiter_bytes(settings.FIGMA_STREAM_CHUNK_SIZE))
     
     async def get_file_images(self, file_key: str, node_ids: List[str], format: str = "svg") -> Dict:
         """피그마 이미지 가져오기"""
@@ -36,57 +170,72 @@ class FigmaService:
             response = await client.get(url, headers=headers)
             return response.json()
     
-    async def extract_design_tokens(self, figma_data: Dict) -> Dict:
+    async def extract_design_tokens(self, figma_data: Union[Dict, FigmaSubtree],
+                                    max_depth: Optional[int] = None) -> Dict:
         """피그마 데이터에서 디자인 토큰 추출"""
         
-        design_tokens = {
-            "colors": {},
-            "typography": {},
-            "spacing": {},
-            "components": []
-        }
+        subtree = self._as_subtree(figma_data)
+        await subtree.load(max_depth)
+        
+        # 원시 토큰 수집 후 정규화 단계에서 중복 제거/클러스터링
+        raw_colors = []
+        raw_typography = []
+        raw_spacing = []
         
-        def extract_node(node):
+        async def extract_node(node, level):
+            node_id = node.get("id", "")
+            
             if "fills" in node:
                 for fill in node["fills"]:
                     if fill.get("type") == "SOLID":
                         color = fill["color"]
-                        color_key = f"color-{len(design_tokens['colors'])}"
-                        design_tokens["colors"][color_key] = {
-                            "r": color["r"],
-                            "g": color["g"], 
-                            "b": color["b"],
-                            "a": color.get("a", 1)
-                        }
+                        raw_colors.append((node_id, (
+                            color["r"],
+                            color["g"],
+                            color["b"],
+                            color.get("a", 1)
+                        )))
             
             if "style" in node and "fontFamily" in node["style"]:
-                font_key = f"font-{len(design_tokens['typography'])}"
-                design_tokens["typography"][font_key] = {
-                    "fontFamily": node["style"]["fontFamily"],
-                    "fontSize": node["style"].get("fontSize", 16),
-                    "fontWeight": node["style"].get("fontWeight", 400)
-                }
+                raw_typography.append((node_id, (
+                    node["style"]["fontFamily"],
+                    node["style"].get("fontSize", 16),
+                    node["style"].get("fontWeight", 400)
+                )))
+            
+            # 오토 레이아웃 간격
+            for spacing_key in SPACING_KEYS:
+                if spacing_key in node:
+                    raw_spacing.append((node_id, node[spacing_key]))
             
-            if "children" in node:
-                for child in node["children"]:
-                    extract_node(child)
+            # max_depth는 지연 로딩 범위만 제한 (이미 있는 자식은 모두 순회)
+            for child in await subtree.children(node, max_depth):
+                await extract_node(child, level + 1)
         
         # 문서 전체 순회
-        if "document" in figma_data:
-            extract_node(figma_data["document"])
+        if "document" in subtree.data:
+            await extract_node(subtree.data["document"], 0)
+        
+        # 클러스터링은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        design_tokens = await asyncio.to_thread(token_normalizer.normalize, raw_colors, raw_typography, raw_spacing)
+        design_tokens["components"] = []
         
         return design_tokens
     
-    async def parse_figma_to_code_structure(self, figma_data: Dict) -> Dict:
+    async def parse_figma_to_code_structure(self, figma_data: Union[Dict, FigmaSubtree],
+                                            max_depth: Optional[int] = None) -> Dict:
         """피그마 데이터를 코드 구조로 파싱"""
         
+        subtree = self._as_subtree(figma_data)
+        await subtree.load(max_depth)
+        
         code_structure = {
             "components": [],
             "layout": {},
             "styles": {}
         }
         
-        def parse_node(node, parent_name=""):
+        async def parse_node(node, level, parent_name=""):
             component = {
                 "name": node.get("name", "Unknown"),
                 "type": node.get("type", "FRAME"),
@@ -106,16 +255,21 @@ class FigmaService:
                 component["styles"]["typography"] = node["style"]
             
             # 자식 요소 처리
-            if "children" in node:
-                for child in node["children"]:
-                    child_component = parse_node(child, component["name"])
-                    component["children"].append(child_component)
+            for child in await subtree.children(node, max_depth):
+                child_component = await parse_node(child, level + 1, component["name"])
+                component["children"].append(child_component)
             
             return component
         
-        if "document" in figma_data:
-            code_structure["components"] = [parse_node(figma_data["document"])]
+        if "document" in subtree.data:
+            code_structure["components"] = [await parse_node(subtree.data["document"], 0)]
         
         return code_structure
+    
+    def _as_subtree(self, figma_data: Union[Dict, FigmaSubtree]) -> FigmaSubtree:
+        """일반 dict 데이터도 동일한 방식으로 순회할 수 있도록 감싸기"""
+        if isinstance(figma_data, FigmaSubtree):
+            return figma_data
+        return FigmaSubtree(figma_data)
 
 figma_service = FigmaService() 
\ No newline at end of file
@@ -0,0 +1,115 @@
+import ijson
+from typing import AsyncIterator, Dict, Iterable, Optional
+
+# 토큰/구조 추출기와 코드 생성 프롬프트가 사용하는 노드 필드
+# (벡터 geometry, export/plugin 데이터, 프로토타입 인터랙션 등 그 외 필드는 읽는 즉시 버림)
+NODE_KEYS = {
+    # 구조
+    "id", "name", "type", "children", "visible", "componentId", "componentProperties",
+    # 텍스트
+    "characters", "style", "characterStyleOverrides", "styleOverrideTable",
+    # 시각 스타일
+    "fills", "strokes", "strokeWeight", "strokeAlign", "strokeDashes", "individualStrokeWeights",
+    "cornerRadius", "rectangleCornerRadii", "effects", "opacity", "blendMode", "isMask",
+    "backgroundColor", "clipsContent",
+    # 크기/위치
+    "absoluteBoundingBox", "constraints", "minWidth", "maxWidth", "minHeight", "maxHeight",
+    # 오토 레이아웃
+    "layoutMode", "layoutWrap", "layoutAlign", "layoutGrow", "layoutPositioning",
+    "layoutSizingHorizontal", "layoutSizingVertical",
+    "primaryAxisSizingMode", "counterAxisSizingMode",
+    "primaryAxisAlignItems", "counterAxisAlignItems", "counterAxisAlignContent",
+    "itemSpacing", "counterAxisSpacing",
+    "paddingLeft", "paddingRight", "paddingTop", "paddingBottom"
+}
+
+# 노드가 아닌 객체에서 버리는 필드
+SKIP_KEYS = {"components", "componentSets", "styles", "schemaVersion"}
+
+class FigmaStreamParser:
+    """피그마 JSON 응답을 이벤트 단위로 파싱하여 필요한 필드만 남긴 트리 생성"""
+
+    def __init__(self, node_keys: Optional[Iterable[str]] = None):
+        self.node_keys = set(node_keys) if node_keys is not None else NODE_KEYS
+        self.events = ijson.sendable_list()
+        self._coro = ijson.basic_parse_coro(self.events, use_float=True)
+        self.root = None
+        # (컨테이너, 플래그) - dict면 노드 여부, list면 children 배열 여부
+        self._stack = []
+        self._key = None
+        self._skip_next = False
+        self._skip_depth = 0
+
+    def feed(self, chunk: bytes):
+        """바이트 청크 하나를 파싱하고 발생한 이벤트를 트리에 반영"""
+        self._coro.send(chunk)
+        for event, value in self.events:
+            self._handle(event, value)
+        del self.events[:]
+
+    def close(self) -> Dict:
+        """남은 입력을 마무리하고 파싱된 트리 반환"""
+        self._coro.close()
+        for event, value in self.events:
+            self._handle(event, value)
+        del self.events[:]
+        return self.root
+
+    def _handle(self, event: str, value):
+        # 버리는 서브트리 내부 이벤트는 깊이만 추적
+        if self._skip_depth:
+            if event == "start_map" or event == "start_array":
+                self._skip_depth += 1
+            elif event == "end_map" or event == "end_array":
+                self._skip_depth -= 1
+            return
+
+        if self._skip_next:
+            self._skip_next = False
+            if event == "start_map" or event == "start_array":
+                self._skip_depth = 1
+            return
+
+        if event == "map_key":
+            _, is_node = self._stack[-1]
+            keep = value in self.node_keys if is_node else value not in SKIP_KEYS
+            self._key = value
+            self._skip_next = not keep
+        elif event == "start_map":
+            if not self._stack:
+                is_node = False
+            else:
+                parent, flag = self._stack[-1]
+                is_node = flag if isinstance(parent, list) else self._key == "document"
+            container = {}
+            self._add(container)
+            self._stack.append((container, is_node))
+        elif event == "start_array":
+            is_children = False
+            if self._stack:
+                parent, flag = self._stack[-1]
+                is_children = isinstance(parent, dict) and flag and self._key == "children"
+            container = []
+            self._add(container)
+            self._stack.append((container, is_children))
+        elif event == "end_map" or event == "end_array":
+            self._stack.pop()
+        else:
+            self._add(value)
+
+    def _add(self, value):
+        if not self._stack:
+            self.root = value
+            return
+        parent, _ = self._stack[-1]
+        if isinstance(parent, list):
+            parent.append(value)
+        else:
+            parent[self._key] = value
+
+async def parse_stream(chunks: AsyncIterator[bytes], node_keys: Optional[Iterable[str]] = None) -> Dict:
+    """비동기 바이트 스트림을 점진적으로 파싱"""
+    parser = FigmaStreamParser(node_keys)
+    async for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
@@ -1,8 +1,55 @@
 import google.generativeai as genai
 from typing import Dict, List, Optional
+import asyncio
 import json
+import random
 import re
+import time
 from app.core.config import settings
+from app.core.state import state_store
+from app.services.scaffold_service import scaffold_service
+from app.services.prompt_cache import prompt_cache
+from app.services.code_chunker import build_chunks, estimate_tokens, stitch, strip_code_fence
+
+# 전체 프로젝트를 모델이 작성하는 응답 형식
+FULL_RESPONSE_FORMAT = """다음 형식으로 응답해주세요:
+        {
+            "components": [
+                {
+                    "name": "ComponentName",
+                    "code": "// TypeScript/React 코드",
+                    "dependencies": ["react", "tailwindcss"]
+                }
+            ],
+            "main_file": "// 메인 App.tsx 코드",
+            "package_json": {
+                "dependencies": {},
+                "devDependencies": {}
+            },
+            "readme": "프로젝트 설명"
+        }"""
+
+# 골격(package.json, main_file 보일러플레이트, README)은 로컬에서 렌더링하므로 컴포넌트와 앱 연결 코드만 요청
+SCAFFOLD_RESPONSE_FORMAT = """package.json, README, App 파일의 import/export 보일러플레이트는 작성하지 마세요.
+        각 컴포넌트는 default export 해주세요. 다음 형식으로만 응답해주세요:
+        {
+            "title": "앱 이름",
+            "summary": "한두 문장 설명",
+            "components": [
+                {
+                    "name": "ComponentName",
+                    "code": "// 컴포넌트 코드",
+                    "dependencies": ["추가로 필요한 npm 패키지"]
+                }
+            ],
+            "app_imports": ["컴포넌트 외에 App에 필요한 import 문"],
+            "app_state": "// App 컴포넌트 안의 상태/핸들러 코드 (return 이전)",
+            "app_jsx": "<!-- App이 렌더링할 마크업 -->"
+        }"""
+
+# 프레임워크/생성 모드별 출력 토큰/지연 시간 통계 namespace
+GENERATION_STATS = "generation_stats"
+GENERATION_MODES = ("full", "scaffold")
 
 class GeminiService:
     def __init__(self):
@@ -12,6 +59,7 @@ class GeminiService:
     async def generate_code_from_figma(self, figma_data: Dict, framework: str = "react") -> Dict:
         """피그마 디자인을 코드로 변환"""
         
+        scaffolded = self._use_scaffold(framework)
         prompt = f"""
         피그마 디자인을 {framework} 코드로 변환해주세요.
         
@@ -25,34 +73,24 @@ class GeminiService:
         4. 컴포넌트 기반 구조
         5. 접근성 고려
         
-        다음 형식으로 응답해주세요:
-        {{
-            "components": [
-                {{
-                    "name": "ComponentName",
-                    "code": "// TypeScript/React 코드",
-                    "dependencies": ["react", "tailwindcss"]
-                }}
-            ],
-            "main_file": "// 메인 App.tsx 코드",
-            "package_json": {{
-                "dependencies": {{}},
-                "devDependencies": {{}}
-            }},
-            "readme": "프로젝트 설명"
-        }}
+        {self._response_format(scaffolded)}
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text)
-            return result
+            return await self._generate_project(prompt, framework, scaffolded)
         except Exception as e:
             return {"error": str(e)}
     
     async def generate_code_from_description(self, description: str, framework: str = "react") -> Dict:
         """텍스트 설명을 코드로 변환"""
         
+        # 표현만 조금 다른 이전 요청이 있으면 캐시된 결과 사용
+        if settings.PROMPT_CACHE_ENABLED:
+            cached = await prompt_cache.lookup(description, framework)
+            if cached is not None:
+                return cached
+        
+        scaffolded = self._use_scaffold(framework)
         prompt = f"""
         다음 설명을 바탕으로 {framework} 애플리케이션을 만들어주세요:
         
@@ -65,34 +103,91 @@ class GeminiService:
         4. 반응형 디자인
         5. 실제 배포 가능한 코드
         
-        다음 형식으로 응답해주세요:
-        {{
-            "components": [
-                {{
-                    "name": "ComponentName",
-                    "code": "// TypeScript/React 코드",
-                    "dependencies": ["react", "tailwindcss"]
-                }}
-            ],
-            "main_file": "// 메인 App.tsx 코드",
-            "package_json": {{
-                "dependencies": {{}},
-                "devDependencies": {{}}
-            }},
-            "readme": "프로젝트 설명"
-        }}
+        {self._response_format(scaffolded)}
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text)
+            result = await self._generate_project(prompt, framework, scaffolded)
+            if settings.PROMPT_CACHE_ENABLED:
+                await prompt_cache.store(description, framework, result)
             return result
         except Exception as e:
             return {"error": str(e)}
     
+    def _use_scaffold(self, framework: str) -> bool:
+        """골격 모드 사용 여부 (SCAFFOLD_BASELINE_RATE 비율은 비교용으로 전체 생성 모드 사용)"""
+        if not scaffold_service.supports(framework):
+            return False
+        return random.random() >= settings.SCAFFOLD_BASELINE_RATE
+    
+    def _response_format(self, scaffolded: bool) -> str:
+        return SCAFFOLD_RESPONSE_FORMAT if scaffolded else FULL_RESPONSE_FORMAT
+    
+    async def _generate_project(self, prompt: str, framework: str, scaffolded: bool) -> Dict:
+        """프로젝트 생성 요청 후 (골격 모드면) 로컬 골격과 병합"""
+        
+        started = time.perf_counter()
+        response = await self.model.generate_content_async(prompt)
+        elapsed = time.perf_counter() - started
+        
+        result = json.loads(strip_code_fence(response.text))
+        await self._record_generation(framework, "scaffold" if scaffolded else "full", response, elapsed)
+        
+        if scaffolded:
+            return scaffold_service.render(framework, result)
+        return result
+    
+    async def _record_generation(self, framework: str, mode: str, response, elapsed: float):
+        """프레임워크/모드별 출력 토큰 수와 응답 시간 누적 (골격 모드 절감 효과 측정용)"""
+        usage = getattr(response, "usage_metadata", None)
+        output_tokens = getattr(usage, "candidates_token_count", 0) or estimate_tokens(response.text)
+        await state_store.update(
+            GENERATION_STATS, "frameworks", lambda frameworks: sorted(set(frameworks or []) | {framework})
+        )
+        await state_store.incr(GENERATION_STATS, f"{framework}:{mode}:requests")
+        await state_store.incr(GENERATION_STATS, f"{framework}:{mode}:output_tokens", int(output_tokens))
+        await state_store.incr(GENERATION_STATS, f"{framework}:{mode}:seconds", float(elapsed))
+    
+    async def get_generation_stats(self) -> Dict:
+        """프레임워크별 모드 평균 출력 토큰/지연 시간과 골격 모드의 절감량
+
+        절감량은 같은 프레임워크에서 두 모드 모두 표본이 있을 때만 계산한다
+        (전체 생성 표본은 SCAFFOLD_BASELINE_RATE로 수집).
+        """
+        
+        stats = {}
+        for framework in await state_store.get(GENERATION_STATS, "frameworks") or []:
+            framework_stats = {}
+            for mode in GENERATION_MODES:
+                requests = await state_store.get(GENERATION_STATS, f"{framework}:{mode}:requests") or 0
+                tokens = await state_store.get(GENERATION_STATS, f"{framework}:{mode}:output_tokens") or 0
+                seconds = await state_store.get(GENERATION_STATS, f"{framework}:{mode}:seconds") or 0.0
+                framework_stats[mode] = {
+                    "requests": requests,
+                    "avg_output_tokens": tokens / requests if requests else None,
+                    "avg_seconds": float(seconds) / requests if requests else None
+                }
+            
+            full, scaffold = framework_stats["full"], framework_stats["scaffold"]
+            if full["requests"] and scaffold["requests"]:
+                framework_stats["output_token_reduction"] = 1 - scaffold["avg_output_tokens"] / full["avg_output_tokens"]
+                framework_stats["seconds_saved_per_request"] = full["avg_seconds"] - scaffold["avg_seconds"]
+            stats[framework] = framework_stats
+        return stats
+    
     async def optimize_code(self, code: str, optimization_type: str = "performance") -> str:
         """코드 최적화"""
         
+        # 큰 파일은 최상위 선언 단위로 나눠 병렬 처리
+        if estimate_tokens(code) > settings.CODE_CHUNK_TOKENS:
+            try:
+                return await self._process_in_chunks(
+                    code,
+                    f"대상 코드를 {optimization_type} 관점에서 최적화해주세요 (성능, 가독성, 모범 사례, 버그 수정)."
+                )
+            except Exception as e:
+                return f"최적화 실패: {str(e)}"
+        
         prompt = f"""
         다음 코드를 {optimization_type} 관점에서 최적화해주세요:
         
@@ -108,7 +203,7 @@ class GeminiService:
         """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             return response.text
         except Exception as e:
             return f"최적화 실패: {str(e)}"
@@ -116,6 +211,16 @@ class GeminiService:
     async def debug_code(self, code: str, error_message: str) -> str:
         """코드 디버깅"""
         
+        if estimate_tokens(code) > settings.CODE_CHUNK_TOKENS:
+            try:
+                return await self._process_in_chunks(
+                    code,
+                    f"다음 오류 메시지와 관련된 문제가 대상 코드에 있다면 수정해주세요. "
+                    f"관련이 없다면 대상 코드를 그대로 반환해주세요.\n오류 메시지: {error_message}"
+                )
+            except Exception as e:
+                return f"디버깅 실패: {str(e)}"
+    
         prompt = f"""
         다음 코드에서 발생한 오류를 수정해주세요:
         
@@ -129,9 +234,34 @@ class GeminiService:
         """
         
         try:
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             return response.text
         except Exception as e:
             return f"디버깅 실패: {str(e)}"
+    
+    async def _process_in_chunks(self, code: str, instruction: str) -> str:
+        """코드를 청크로 나눠 공유 컨텍스트(import/타입 선언)와 함께 동시에 처리한 뒤 순서대로 조립"""
+        
+        plan = build_chunks(code, settings.CODE_CHUNK_TOKENS)
+        semaphore = asyncio.Semaphore(settings.CODE_CHUNK_CONCURRENCY)
+        
+        async def process(chunk: str) -> str:
+            prompt = f"""
+        아래는 큰 소스 파일의 일부입니다. {instruction}
+        
+        공유 컨텍스트 (참고용, 반환하지 마세요):
+        {plan["context"]}
+        
+        대상 코드:
+        {chunk}
+        
+        대상 코드 부분의 결과 코드만 반환해주세요.
+        """
+            async with semaphore:
+                response = await self.model.generate_content_async(prompt)
+            return strip_code_fence(response.text)
+        
+        results = await asyncio.gather(*(process(chunk) for chunk in plan["chunks"]))
+        return stitch(plan["parts"], results)
 
 gemini_service = GeminiService() 
\ No newline at end of file
@@ -0,0 +1,114 @@
+import json
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.services.blob_store import BlobStore, blob_store
+
+# 컴포넌트 의존성 등 파일로 표현되지 않는 정보
+META_PATH = ".outer/meta.json"
+
+class ProjectStorageService:
+    """생성된 코드를 파일 단위 blob + 매니페스트로 저장하고 버전 이력 관리"""
+
+    def __init__(self, store: Optional[BlobStore] = None):
+        self.store = store or blob_store
+
+    def code_to_files(self, code: Dict) -> Dict[str, str]:
+        """생성 결과(dict)를 배포와 같은 파일 레이아웃으로 변환"""
+
+        files = {}
+        meta = {"keys": list(code.keys()), "components": [], "extra": {}}
+
+        for key, value in code.items():
+            if key == "components" and isinstance(value, list):
+                for component in value:
+                    path = f"src/components/{component['name']}.tsx"
+                    # 같은 경로에 덮어쓰면 복원 시 한 컴포넌트 코드만 남음
+                    if path in files:
+                        raise ValueError(f"Duplicate component name: {component['name']}")
+                    files[path] = component.get("code", "")
+                    meta["components"].append({k: v for k, v in component.items() if k != "code"})
+            elif key == "main_file" and isinstance(value, str):
+                files["src/App.tsx"] = value
+            elif key == "package_json" and isinstance(value, dict):
+                files["package.json"] = json.dumps(value, indent=2, ensure_ascii=False)
+            elif key == "readme" and isinstance(value, str):
+                files["README.md"] = value
+            else:
+                meta["extra"][key] = value
+
+        files[META_PATH] = json.dumps(meta, sort_keys=True, ensure_ascii=False)
+        return files
+
+    def files_to_code(self, files: Dict[str, str]) -> Dict:
+        """파일 레이아웃을 원래 생성 결과(dict) 형태로 복원"""
+
+        meta = json.loads(files.get(META_PATH, "{}"))
+        restored = {
+            "components": [
+                dict(component, code=files.get(f"src/components/{component['name']}.tsx", ""))
+                for component in meta.get("components", [])
+            ],
+            "main_file": files.get("src/App.tsx"),
+            "package_json": json.loads(files["package.json"]) if "package.json" in files else None,
+            "readme": files.get("README.md"),
+        }
+        restored.update(meta.get("extra", {}))
+
+        return {key: restored.get(key) for key in meta.get("keys", restored.keys())}
+
+    def save_code(self, code: Dict) -> str:
+        """파일별 blob 저장 후 매니페스트 해시 반환"""
+        manifest = {
+            path: self.store.put_text(content)
+            for path, content in self.code_to_files(code).items()
+        }
+        return self.store.put_json({"files": manifest})
+
+    def load_manifest(self, manifest_hash: str) -> Dict[str, str]:
+        """매니페스트 조회 (경로 -> blob 해시)"""
+        return self.store.get_json(manifest_hash)["files"]
+
+    def load_files(self, manifest_hash: str) -> Dict[str, str]:
+        return {
+            path: self.store.get_text(blob_hash)
+            for path, blob_hash in self.load_manifest(manifest_hash).items()
+        }
+
+    def load_code(self, manifest_hash: str) -> Dict:
+        return self.files_to_code(self.load_files(manifest_hash))
+
+    def add_version(self, versions: List[Dict], code: Dict) -> Dict:
+        """새 버전 추가 (직전 버전과 내용이 같으면 기존 버전 반환)"""
+        return self.add_manifest_version(versions, self.save_code(code))
+
+    def add_manifest_version(self, versions: List[Dict], manifest_hash: str) -> Dict:
+        """이미 저장된 매니페스트로 새 버전 추가 (직전 버전과 같으면 기존 버전 반환)"""
+
+        if versions and versions[-1]["manifest"] == manifest_hash:
+            return versions[-1]
+
+        version = {
+            "version": len(versions) + 1,
+            "manifest": manifest_hash,
+            "created_at": datetime.now().isoformat()
+        }
+        versions.append(version)
+        return version
+
+    def diff(self, from_manifest: str, to_manifest: str) -> Dict:
+        """두 매니페스트의 파일 변경 목록 (blob 해시 비교만으로 계산)"""
+
+        before = self.load_manifest(from_manifest)
+        after = self.load_manifest(to_manifest)
+
+        return {
+            "added": sorted(path for path in after if path not in before),
+            "removed": sorted(path for path in before if path not in after),
+            "modified": sorted(
+                path for path in after
+                if path in before and before[path] != after[path]
+            ),
+            "unchanged": sum(1 for path in after if before.get(path) == after[path])
+        }
+
+project_storage_service = ProjectStorageService()
@@ -0,0 +1,132 @@
+import hashlib
+import logging
+import re
+import unicodedata
+import uuid
+import numpy as np
+from typing import Dict, List, Optional, Set
+from app.core.config import settings
+from app.core.state import state_store
+
+logger = logging.getLogger(__name__)
+
+# 설명의 의미에 거의 영향이 없는 단어
+STOPWORDS = {
+    "a", "an", "the", "with", "and", "or", "of", "for", "to", "in", "on", "that",
+    "please", "make", "create", "build", "me", "my", "some", "using", "use"
+}
+
+ENTRIES = "prompt_cache"
+BUCKETS = "prompt_cache_buckets"
+
+# (a * x + b) mod p 계산이 uint64 안에서 넘치지 않도록 31비트 소수 사용
+_PRIME = (1 << 31) - 1
+
+def normalize_description(description: str) -> List[str]:
+    """대소문자/공백/문장부호 차이를 없앤 단어 목록"""
+    text = unicodedata.normalize("NFKC", description).lower()
+    return [word for word in re.findall(r"\w+", text) if word not in STOPWORDS]
+
+def shingles(words: List[str]) -> Set[str]:
+    """단어 + 인접 단어 쌍 (문자 n-gram은 "blue"/"red"처럼 의미가 다른 단어도 많이 겹치므로 사용하지 않음)"""
+    result = set(words)
+    result.update(f"{left} {right}" for left, right in zip(words, words[1:]))
+    return result
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+class PromptCache:
+    """MinHash + LSH 기반 유사 설명 캐시 (외부 임베딩 서비스 없이 로컬 계산)"""
+
+    def __init__(self, num_perm: Optional[int] = None, bands: Optional[int] = None,
+                 threshold: Optional[float] = None, ttl: Optional[float] = None,
+                 max_diff: Optional[int] = None):
+        self.num_perm = num_perm or settings.PROMPT_CACHE_NUM_PERM
+        self.bands = bands or settings.PROMPT_CACHE_BANDS
+        self.rows = self.num_perm // self.bands
+        self.threshold = threshold if threshold is not None else settings.PROMPT_CACHE_THRESHOLD
+        self.ttl = ttl if ttl is not None else settings.PROMPT_CACHE_TTL
+        self.max_diff = max_diff if max_diff is not None else settings.PROMPT_CACHE_MAX_DIFF
+
+        # 워커 간 같은 서명이 나오도록 고정 시드 사용
+        generator = np.random.default_rng(1)
+        self._a = generator.integers(1, _PRIME, self.num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, _PRIME, self.num_perm, dtype=np.uint64)
+
+    def signature(self, tokens: Set[str]) -> np.ndarray:
+        """MinHash 서명 계산 (LSH 후보 검색용)"""
+        tokens = tokens or {""}
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "little") % _PRIME
+             for token in tokens],
+            dtype=np.uint64
+        )
+        permuted = (hashes[:, None] * self._a[None, :] + self._b[None, :]) % np.uint64(_PRIME)
+        return permuted.min(axis=0)
+
+    def _band_keys(self, framework: str, signature: np.ndarray) -> List[str]:
+        return [
+            f"{framework}:{band}:{hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8).hexdigest()}"
+            for band in range(self.bands)
+        ]
+
+    async def lookup(self, description: str, framework: str) -> Optional[Dict]:
+        """같은 프레임워크의 유사한 이전 요청 결과 조회 (임계값 미만이면 None)"""
+
+        tokens = shingles(normalize_description(description))
+        signature = self.signature(tokens)
+        candidates = set()
+        for bucket in await state_store.get_many(BUCKETS, self._band_keys(framework, signature)):
+            candidates.update(bucket or [])
+
+        best, best_score, best_diff = None, 0.0, 0
+        # 후보 항목은 한 번에 조회 (Redis는 MGET 한 번)
+        for entry in await state_store.get_many(ENTRIES, sorted(candidates)):
+            # 이전 형식(shingle 미저장) 항목은 무시
+            if not entry or entry["framework"] != framework or "shingles" not in entry:
+                continue
+            # MinHash 추정치의 오차를 피하기 위해 최종 판정은 저장된 shingle로 정확히 계산
+            cached = set(entry["shingles"])
+            score = jaccard(tokens, cached)
+            if score > best_score:
+                best, best_score, best_diff = entry, score, len(tokens ^ cached)
+
+        if best is None:
+            logger.info("prompt cache miss (no candidates): framework=%s", framework)
+            return None
+
+        # 비율만 보면 긴 설명에서 단어 하나가 바뀐 경우(blue -> red)도 임계값을 넘으므로 차이 개수도 제한
+        hit = best_score >= self.threshold and best_diff <= self.max_diff
+        # 임계값 튜닝용: 가장 가까운 후보와의 유사도를 항상 기록
+        logger.info(
+            "prompt cache %s: similarity=%.3f diff=%d threshold=%.2f max_diff=%d framework=%s query=%r cached=%r",
+            "hit" if hit else "miss", best_score, best_diff, self.threshold, self.max_diff, framework,
+            description[:120], best["description"][:120]
+        )
+        return best["result"] if hit else None
+
+    async def store(self, description: str, framework: str, result: Dict):
+        """생성 결과 저장 및 LSH 버킷 등록"""
+
+        tokens = shingles(normalize_description(description))
+        signature = self.signature(tokens)
+        entry_id = uuid.uuid4().hex
+        await state_store.set(ENTRIES, entry_id, {
+            "description": description,
+            "framework": framework,
+            "shingles": sorted(tokens),
+            "result": result
+        }, ttl=self.ttl)
+
+        def append(bucket: Optional[List[str]]) -> List[str]:
+            # 만료된 항목은 조회 시 무시되므로 버킷 크기만 제한
+            return ((bucket or []) + [entry_id])[-settings.PROMPT_CACHE_BUCKET_SIZE:]
+
+        # 다른 요청/워커가 같은 버킷에 동시에 추가해도 항목을 잃지 않도록 원자적으로 갱신
+        for band_key in self._band_keys(framework, signature):
+            await state_store.update(BUCKETS, band_key, append, ttl=self.ttl)
+
+prompt_cache = PromptCache()
@@ -0,0 +1,62 @@
+import json
+import os
+import re
+from typing import Dict, List
+from jinja2 import Environment, FileSystemLoader
+from app.core.config import settings
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "scaffold")
+
+class ScaffoldService:
+    """프레임워크별 프로젝트 골격(main_file, package.json, README)을 로컬에서 렌더링"""
+
+    def __init__(self, template_dir: str = TEMPLATE_DIR):
+        self.template_dir = template_dir
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            keep_trailing_newline=True,
+            autoescape=False
+        )
+
+    def supports(self, framework: str) -> bool:
+        return settings.SCAFFOLD_ENABLED and os.path.isfile(
+            os.path.join(self.template_dir, framework, "main_file.j2")
+        )
+
+    def render(self, framework: str, generated: Dict) -> Dict:
+        """모델이 생성한 컴포넌트/앱 연결 코드를 골격과 합쳐 기존 응답 형태로 반환"""
+
+        components: List[Dict] = generated.get("components", [])
+        title = generated.get("title") or "Generated App"
+        context = {
+            "framework": framework,
+            "name": self._package_name(title),
+            "title": title,
+            "summary": generated.get("summary", ""),
+            "components": components,
+            "imports": generated.get("app_imports", []),
+            "state": (generated.get("app_state") or "").strip(),
+            "jsx": (generated.get("app_jsx") or "").strip()
+        }
+
+        package_json = json.loads(self.env.get_template(f"{framework}/package.json.j2").render(context))
+        # 골격에 없는 컴포넌트 의존성 추가
+        known = {**package_json.get("dependencies", {}), **package_json.get("devDependencies", {})}
+        for component in components:
+            for dependency in component.get("dependencies", []):
+                if dependency not in known:
+                    package_json["dependencies"][dependency] = "latest"
+                    known[dependency] = "latest"
+
+        return {
+            "components": components,
+            "main_file": self.env.get_template(f"{framework}/main_file.j2").render(context),
+            "package_json": package_json,
+            "readme": self.env.get_template("README.md.j2").render(context)
+        }
+
+    def _package_name(self, title: str) -> str:
+        name = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+        return name or "generated-app"
+
+scaffold_service = ScaffoldService()
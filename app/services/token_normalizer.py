@@ -0,0 +1,194 @@
+import numpy as np
+from typing import Dict, List, Tuple
+from app.core.config import settings
+
+# sRGB(D65) -> XYZ 변환 행렬
+_SRGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+_LAB_EPSILON = 216 / 24389
+_LAB_KAPPA = 24389 / 27
+
+# 원시 토큰 항목: (node_id, 값)
+ColorEntry = Tuple[str, Tuple[float, float, float, float]]
+TypographyEntry = Tuple[str, Tuple[str, float, float]]
+SpacingEntry = Tuple[str, float]
+
+
+def _srgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """0~1 범위의 sRGB 배열(n, 3)을 CIELAB 배열(n, 3)로 변환"""
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = (linear @ _SRGB_TO_XYZ.T) / _D65_WHITE
+    f = np.where(xyz > _LAB_EPSILON, np.cbrt(xyz), (_LAB_KAPPA * xyz + 16) / 116)
+    return np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2]),
+    ], axis=1)
+
+
+class _LabGrid:
+    """Lab 좌표를 cell_size 격자로 나눈 색 인덱스 (임계값 이내 후보만 조회)"""
+
+    _OFFSETS = [(dl, da, db) for dl in (-1, 0, 1) for da in (-1, 0, 1) for db in (-1, 0, 1)]
+
+    def __init__(self, lab: np.ndarray, cell_size: float):
+        coords = np.floor(lab / cell_size).astype(np.int64)
+        self.coords = [tuple(cell) for cell in coords.tolist()]
+        members: Dict[Tuple[int, int, int], List[int]] = {}
+        for idx, cell in enumerate(self.coords):
+            members.setdefault(cell, []).append(idx)
+        self.cells = {cell: np.asarray(indices, dtype=np.int64) for cell, indices in members.items()}
+
+    def neighbors(self, idx: int) -> np.ndarray:
+        """idx가 속한 셀과 인접한 26개 셀의 색 인덱스"""
+        l, a, b = self.coords[idx]
+        found = [self.cells.get((l + dl, a + da, b + db)) for dl, da, db in self._OFFSETS]
+        return np.concatenate([indices for indices in found if indices is not None])
+
+
+class TokenNormalizer:
+    def __init__(self, color_threshold: float = None, spacing_tolerance: float = None):
+        # 색상 클러스터링 기준 (CIE76 ΔE, 알파 차이는 0~100 스케일로 합산)
+        self.color_threshold = (
+            color_threshold if color_threshold is not None
+            else settings.DESIGN_TOKEN_COLOR_THRESHOLD
+        )
+        # 간격 값 병합 단위 (px)
+        self.spacing_tolerance = (
+            spacing_tolerance if spacing_tolerance is not None
+            else settings.DESIGN_TOKEN_SPACING_TOLERANCE
+        )
+
+    def normalize(
+        self,
+        colors: List[ColorEntry],
+        typography: List[TypographyEntry],
+        spacing: List[SpacingEntry],
+    ) -> Dict:
+        """원시 토큰 목록을 중복 제거/클러스터링하여 압축된 토큰 세트와 노드 인덱스 생성"""
+
+        color_tokens, color_keys = self.normalize_colors([value for _, value in colors])
+        typography_tokens, typography_keys = self.normalize_typography([value for _, value in typography])
+        spacing_tokens, spacing_keys = self.normalize_spacing([value for _, value in spacing])
+
+        # 노드 -> 토큰 인덱스
+        node_tokens: Dict[str, Dict[str, List[str]]] = {}
+        for category, entries, keys in (
+            ("colors", colors, color_keys),
+            ("typography", typography, typography_keys),
+            ("spacing", spacing, spacing_keys),
+        ):
+            for (node_id, _), key in zip(entries, keys):
+                refs = node_tokens.setdefault(node_id, {}).setdefault(category, [])
+                if key not in refs:
+                    refs.append(key)
+
+        return {
+            "colors": color_tokens,
+            "typography": typography_tokens,
+            "spacing": spacing_tokens,
+            "node_tokens": node_tokens,
+        }
+
+    def normalize_colors(self, values: List[Tuple[float, float, float, float]]) -> Tuple[Dict, List[str]]:
+        """RGBA 값을 8비트로 양자화해 중복 제거 후 지각적 거리로 클러스터링"""
+
+        if not values:
+            return {}, []
+
+        quantized = np.round(np.clip(np.asarray(values, dtype=np.float64), 0, 1) * 255).astype(np.int16)
+        unique, inverse, counts = np.unique(quantized, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+
+        features = np.hstack([
+            _srgb_to_lab(unique[:, :3] / 255.0),
+            unique[:, 3:4] / 255.0 * 100,
+        ])
+
+        # 가장 많이 쓰인 색부터 대표색으로 삼아 임계값 이내의 색을 흡수 (리더 클러스터링)
+        # 임계값 크기의 Lab 격자에 색을 나눠 담고 인접 셀(3x3x3)만 비교
+        cells = self._lab_cells(features[:, :3])
+        cluster_of = np.full(len(unique), -1, dtype=np.int64)
+        leaders = []
+        for idx in np.argsort(-counts, kind="stable").tolist():
+            if cluster_of[idx] >= 0:
+                continue
+            candidates = cells.neighbors(idx)
+            candidates = candidates[cluster_of[candidates] < 0]
+            distance = np.linalg.norm(features[candidates] - features[idx], axis=1)
+            cluster_of[candidates[distance <= self.color_threshold]] = len(leaders)
+            leaders.append(idx)
+
+        labels = cluster_of[inverse]
+        cluster_counts = np.bincount(labels, minlength=len(leaders))
+
+        tokens = {}
+        for cluster, idx in enumerate(leaders):
+            r, g, b, a = (unique[idx] / 255.0).round(4).tolist()
+            tokens[f"color-{cluster}"] = {
+                "r": r,
+                "g": g,
+                "b": b,
+                "a": a,
+                "hex": "#{:02x}{:02x}{:02x}".format(*unique[idx, :3].tolist()),
+                "count": int(cluster_counts[cluster]),
+            }
+
+        return tokens, [f"color-{label}" for label in labels.tolist()]
+
+    def _lab_cells(self, lab: np.ndarray) -> "_LabGrid":
+        return _LabGrid(lab, max(self.color_threshold, 1e-6))
+
+    def normalize_typography(self, values: List[Tuple[str, float, float]]) -> Tuple[Dict, List[str]]:
+        """(fontFamily, fontSize, fontWeight) 조합의 중복 제거"""
+
+        if not values:
+            return {}, []
+
+        families, family_codes = np.unique([family for family, _, _ in values], return_inverse=True)
+        rows = np.column_stack([
+            family_codes.reshape(-1),
+            # 0.5px 미만의 폰트 크기 차이는 같은 스타일로 취급
+            np.round(np.asarray([size for _, size, _ in values], dtype=np.float64) * 2) / 2,
+            np.asarray([weight for _, _, weight in values], dtype=np.float64),
+        ])
+        unique, inverse, counts = np.unique(rows, axis=0, return_inverse=True, return_counts=True)
+
+        # 사용 빈도 순으로 키 부여
+        order = np.argsort(-counts, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        tokens = {}
+        for idx in order.tolist():
+            family_code, size, weight = unique[idx]
+            tokens[f"font-{rank[idx]}"] = {
+                "fontFamily": str(families[int(family_code)]),
+                "fontSize": float(size),
+                "fontWeight": int(weight) if weight.is_integer() else weight,
+                "count": int(counts[idx]),
+            }
+
+        return tokens, [f"font-{label}" for label in rank[inverse.reshape(-1)].tolist()]
+
+    def normalize_spacing(self, values: List[float]) -> Tuple[Dict, List[str]]:
+        """간격 값을 허용 오차 단위로 스냅한 뒤 오름차순 스케일로 정리"""
+
+        if not values:
+            return {}, []
+
+        snapped = np.round(np.asarray(values, dtype=np.float64) / self.spacing_tolerance) * self.spacing_tolerance
+        unique, inverse, counts = np.unique(snapped, return_inverse=True, return_counts=True)
+
+        tokens = {
+            f"spacing-{idx}": {"value": value, "count": int(count)}
+            for idx, (value, count) in enumerate(zip(unique.tolist(), counts.tolist()))
+        }
+
+        return tokens, [f"spacing-{label}" for label in inverse.reshape(-1).tolist()]
+
+token_normalizer = TokenNormalizer()
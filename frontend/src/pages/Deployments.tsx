@@ -21,30 +21,39 @@ const Deployments: React.FC = () => {
     fetchDeployments();
   }, []);
 
+  // 진행 중인 배포는 SSE로 상태 변경을 받음
+  useEffect(() => {
+    const sources = deployments
+      .filter((deployment) => deployment.status === 'building')
+      .map((deployment) => {
+        const source = new EventSource(`/api/v1/deploy/status/${deployment.id}/events`);
+        source.addEventListener('status', (event) => {
+          const data = JSON.parse((event as MessageEvent).data);
+          setDeployments((prev) =>
+            prev.map((item) =>
+              item.id === deployment.id
+                ? { ...item, status: data.status, updated_at: data.last_updated }
+                : item
+            )
+          );
+          if (data.status !== 'building') {
+            source.close();
+          }
+        });
+        source.onerror = () => source.close();
+        return source;
+      });
+
+    return () => sources.forEach((source) => source.close());
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [deployments.map((deployment) => `${deployment.id}:${deployment.status}`).join(',')]);
+
   const fetchDeployments = async () => {
     try {
-      // 실제로는 배포 목록 API를 호출
-      // 임시 데이터 사용
-      const mockDeployments: Deployment[] = [
-        {
-          id: '1',
-          project_name: 'Todo App',
-          platform: 'vercel',
-          status: 'deployed',
-          url: 'https://todo-app-123.vercel.app',
-          created_at: '2024-01-15T10:30:00Z',
-          updated_at: '2024-01-15T10:35:00Z'
-        },
-        {
-          id: '2',
-          project_name: 'Portfolio Website',
-          platform: 'github-pages',
-          status: 'building',
-          created_at: '2024-01-15T09:15:00Z',
-          updated_at: '2024-01-15T09:15:00Z'
-        }
-      ];
-      setDeployments(mockDeployments);
+      const response = await axios.get('/api/v1/deploy/deployments');
+      if (response.data.success) {
+        setDeployments(response.data.deployments);
+      }
     } catch (error) {
       console.error('Error fetching deployments:', error);
       toast.error('배포 목록을 불러오는데 실패했습니다.');
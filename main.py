@@ -1,11 +1,36 @@
+import argparse
+import multiprocessing
 import uvicorn
 from app import app
+from app.core.config import settings
 
-if __name__ == "__main__":
+def run_production(workers: int):
+    """멀티 워커 프로덕션 서버 (공유 상태는 STATE_BACKEND=redis 필요)"""
+    if workers > 1 and settings.STATE_BACKEND != "redis":
+        raise SystemExit("여러 워커를 사용하려면 STATE_BACKEND=redis 설정이 필요합니다.")
+    
     uvicorn.run(
         "app:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=workers,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_TIMEOUT,
         log_level="info"
-    ) 
\ No newline at end of file
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prod", action="store_true", help="멀티 워커 프로덕션 모드")
+    parser.add_argument("--workers", type=int, default=settings.WEB_CONCURRENCY)
+    args = parser.parse_args()
+    
+    if args.prod:
+        run_production(args.workers or multiprocessing.cpu_count())
+    else:
+        uvicorn.run(
+            "app:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
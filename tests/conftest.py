@@ -0,0 +1,5 @@
+import os
+
+# 설정 로딩에 필요한 값 (테스트는 외부 API를 호출하지 않음)
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("STATE_BACKEND", "local")
@@ -0,0 +1,87 @@
+from app.services.code_chunker import build_chunks, split_segments, stitch
+
+def _segments(code: str):
+    return [segment["code"] for segment in split_segments(code)]
+
+def test_template_literal_expression_does_not_split():
+    code = (
+        "const Title = () => {\n"
+        "  const label = `count: ${items.map((item) => {\n"
+        "return item.name;\n"
+        "}).join(', ')}`;\n"
+        "  return <h1>{label}</h1>;\n"
+        "};\n"
+        "const Footer = () => <footer />;\n"
+    )
+
+    segments = _segments(code)
+
+    assert len(segments) == 2
+    assert segments[0].startswith("const Title")
+    assert "return item.name;" in segments[0]
+    assert segments[1].startswith("const Footer")
+
+def test_block_comment_attaches_to_following_declaration():
+    code = (
+        "const a = 1;\n"
+        "/*\n"
+        "Header component\n"
+        "*/\n"
+        "function Header() {\n"
+        "  return null;\n"
+        "}\n"
+    )
+
+    segments = _segments(code)
+
+    assert segments == [
+        "const a = 1;\n",
+        "/*\nHeader component\n*/\nfunction Header() {\n  return null;\n}\n"
+    ]
+
+def test_python_triple_quoted_string_does_not_split():
+    code = (
+        "def render():\n"
+        "    return \"\"\"\n"
+        "def not_a_function():\n"
+        "class NotAClass:\n"
+        "\"\"\"\n"
+        "\n"
+        "def other():\n"
+        "    pass\n"
+    )
+
+    segments = _segments(code)
+
+    assert len(segments) == 2
+    assert "class NotAClass:" in segments[0]
+    assert segments[1] == "def other():\n    pass\n"
+
+def test_stitch_round_trip():
+    code = (
+        "import React from 'react';\n"
+        "import { useState } from 'react';\n"
+        "\n"
+        "// 카운터\n"
+        "export const Counter = () => {\n"
+        "  const [count, setCount] = useState(0);\n"
+        "  return <button onClick={() => setCount(count + 1)}>{`${count} clicks`}</button>;\n"
+        "};\n"
+        "\n"
+        "interface Props {\n"
+        "  title: string;\n"
+        "}\n"
+        "\n"
+        "/**\n"
+        " * 헤더\n"
+        " */\n"
+        "export function Header({ title }: Props) {\n"
+        "  return <h1>{title}</h1>;\n"
+        "}\n"
+        "\n"
+        "export default Counter;\n"
+    )
+
+    for max_tokens in (1, 20, 10000):
+        result = build_chunks(code, max_tokens)
+        assert stitch(result["parts"], result["chunks"]) == code
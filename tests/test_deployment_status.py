@@ -0,0 +1,111 @@
+import asyncio
+import json
+import uuid
+import httpx
+from app import app
+from app.core.config import settings
+from app.services import deployment_status_service as status_module
+from app.services.deployment_status_service import (
+    DeploymentStatusService,
+    FakePlatformClient,
+    deployment_status_service,
+)
+
+def _deployment_id() -> str:
+    # 상태 캐시가 프로세스 전역이므로 테스트마다 다른 배포 ID 사용
+    return f"deploy-{uuid.uuid4().hex}"
+
+class SlowFakePlatformClient(FakePlatformClient):
+    """업스트림 응답 지연을 흉내내는 가짜 플랫폼"""
+
+    async def get_status(self, deployment_id: str) -> str:
+        await asyncio.sleep(0.05)
+        return await super().get_status(deployment_id)
+
+def test_status_is_cached_until_ttl_expires(monkeypatch):
+    monkeypatch.setattr(settings, "DEPLOYMENT_STATUS_TTL", 0.05)
+    fake = FakePlatformClient(["building", "deployed"])
+    service = DeploymentStatusService({"fake": fake})
+    deployment_id = _deployment_id()
+
+    async def scenario():
+        first = await service.get_status("fake", deployment_id)
+        cached = await service.get_status("fake", deployment_id)
+        await asyncio.sleep(0.1)
+        refreshed = await service.get_status("fake", deployment_id)
+        return first, cached, refreshed
+
+    first, cached, refreshed = asyncio.run(scenario())
+
+    assert first["status"] == cached["status"] == "building"
+    assert refreshed["status"] == "deployed"
+    assert fake.calls[deployment_id] == 2
+
+def test_concurrent_lookups_share_one_upstream_call():
+    fake = SlowFakePlatformClient(["deployed"])
+    service = DeploymentStatusService({"fake": fake})
+    deployment_id = _deployment_id()
+
+    async def scenario():
+        return await asyncio.gather(*(service.get_status("fake", deployment_id) for _ in range(10)))
+
+    results = asyncio.run(scenario())
+
+    assert {result["status"] for result in results} == {"deployed"}
+    assert fake.calls[deployment_id] == 1
+
+def test_poll_interval_backs_off_until_status_changes(monkeypatch):
+    monkeypatch.setattr(settings, "DEPLOYMENT_STATUS_TTL", 0.001)
+    monkeypatch.setattr(settings, "DEPLOYMENT_POLL_MIN_INTERVAL", 1.0)
+    monkeypatch.setattr(settings, "DEPLOYMENT_POLL_MAX_INTERVAL", 4.0)
+    fake = FakePlatformClient(["building"] * 5 + ["deployed"])
+    service = DeploymentStatusService({"fake": fake})
+    deployment_id = _deployment_id()
+
+    # 폴링 간격만 기록하고 실제로는 캐시가 만료될 만큼만 대기
+    intervals = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay):
+        intervals.append(delay)
+        await real_sleep(0.005)
+
+    monkeypatch.setattr(status_module.asyncio, "sleep", recording_sleep)
+
+    async def scenario():
+        return [event["status"] async for event in service.subscribe("fake", deployment_id)]
+
+    events = asyncio.run(asyncio.wait_for(scenario(), 5))
+
+    assert events == ["building", "deployed"]
+    assert intervals == [1.0, 2.0, 4.0, 4.0, 4.0]
+    assert fake.calls[deployment_id] == 6
+
+def test_sse_stream_ends_on_terminal_status(monkeypatch):
+    monkeypatch.setattr(settings, "DEPLOYMENT_POLL_MIN_INTERVAL", 0.01)
+    monkeypatch.setattr(settings, "DEPLOYMENT_POLL_MAX_INTERVAL", 0.01)
+    monkeypatch.setattr(settings, "DEPLOYMENT_STATUS_TTL", 0.001)
+    monkeypatch.setitem(
+        deployment_status_service.platforms, "fake", FakePlatformClient(["building", "building", "deployed"])
+    )
+    deployment_id = _deployment_id()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                f"/api/v1/deploy/status/{deployment_id}/events", params={"platform": "fake"}
+            )
+        return response
+
+    response = asyncio.run(asyncio.wait_for(scenario(), 5))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [event["status"] for event in events] == ["building", "deployed"]
+    assert all(event["project_id"] == deployment_id for event in events)